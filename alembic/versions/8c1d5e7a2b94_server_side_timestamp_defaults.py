@@ -0,0 +1,38 @@
+"""server_side_timestamp_defaults
+
+Revision ID: 8c1d5e7a2b94
+Revises: f245e208ccfd
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c1d5e7a2b94'
+down_revision = 'f245e208ccfd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('users', 'created_at',
+               existing_type=sa.DateTime(),
+               existing_nullable=False,
+               server_default=sa.text("timezone('utc', now())"))
+    op.alter_column('users', 'updated_at',
+               existing_type=sa.DateTime(),
+               existing_nullable=False,
+               server_default=sa.text("timezone('utc', now())"))
+
+
+def downgrade() -> None:
+    op.alter_column('users', 'updated_at',
+               existing_type=sa.DateTime(),
+               existing_nullable=False,
+               server_default=None)
+    op.alter_column('users', 'created_at',
+               existing_type=sa.DateTime(),
+               existing_nullable=False,
+               server_default=None)
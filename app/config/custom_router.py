@@ -1,7 +1,31 @@
-from typing import Any, Dict, List, Optional
+import re
+import sys
+from typing import Any, Dict, List, Optional, Set
 
 from fastapi import APIRouter as FastAPIRouter
 
+# Path parameters in route paths (e.g. "{user_id}" or "{user_id:int}")
+PATH_PARAM_PATTERN = re.compile(r"\{[^}]+\}")
+
+# Regex source that a path parameter is converted to (exactly one path segment)
+PATH_PARAM_REGEX = "[^/]+"
+
+
+def path_to_regex(path: str) -> str:
+    """
+    Convert a route path into regular expression source.
+
+    Literal parts of the path are escaped and each path parameter matches exactly
+    one path segment.
+
+    Args:
+        path: Route path, e.g. "/users/{user_id}"
+
+    Returns:
+        Unanchored regular expression source for the path
+    """
+    return PATH_PARAM_REGEX.join(re.escape(chunk) for chunk in PATH_PARAM_PATTERN.split(path))
+
 
 class APIRouter(FastAPIRouter):
     """
@@ -21,8 +45,10 @@ class APIRouter(FastAPIRouter):
         """
         super().__init__(*args, **kwargs)
         self.requires_auth = requires_auth
-        # Store explicit protected route patterns registered during includes
-        self.protected_patterns: List[str] = []
+        # Store explicit protected routes registered during includes:
+        # static paths (no path parameters) and regex sources for parameterized paths
+        self.protected_static: Set[str] = set()
+        self.protected_dynamic: Set[str] = set()
 
     def include_router(
         self,
@@ -58,15 +84,20 @@ class APIRouter(FastAPIRouter):
         # Set the requires_auth flag on the router
         router.requires_auth = requires_auth
 
+        normalized_prefix = prefix if not prefix or prefix.startswith("/") else f"/{prefix}"
+
         # If this include is protected, record exact route patterns for later collection
         if requires_auth:
-            normalized_prefix = prefix if prefix.startswith("/") else f"/{prefix}"
             for r in getattr(router, "routes", []):
                 if hasattr(r, "path"):
-                    full_path = f"{normalized_prefix}{r.path}"
-                    pattern = full_path.replace("{", "*").replace("}", "*")
-                    if pattern not in self.protected_patterns:
-                        self.protected_patterns.append(pattern)
+                    self._add_protected_path(f"{normalized_prefix}{r.path}")
+
+        # Flatten protected patterns already recorded by nested includes, so the
+        # top-level router holds the complete list and no tree walk is needed
+        for path in getattr(router, "protected_static", ()):
+            self.protected_static.add(sys.intern(f"{normalized_prefix}{path}"))
+        for regex_source in getattr(router, "protected_dynamic", ()):
+            self.protected_dynamic.add(sys.intern(f"{re.escape(normalized_prefix)}{regex_source}"))
 
         # Call the parent method
         super().include_router(
@@ -79,3 +110,15 @@ class APIRouter(FastAPIRouter):
             deprecated=deprecated,
             include_in_schema=include_in_schema,
         )
+
+    def _add_protected_path(self, path: str) -> None:
+        """
+        Record a protected route path as a static path or as regex source.
+
+        Args:
+            path: Full route path including the include prefix
+        """
+        if PATH_PARAM_PATTERN.search(path) is None:
+            self.protected_static.add(sys.intern(path))
+        else:
+            self.protected_dynamic.add(sys.intern(path_to_regex(path)))
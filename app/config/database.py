@@ -1,16 +1,27 @@
+import asyncio
 import os
-from typing import Any, AsyncGenerator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator
 
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from app.config.settings import settings
 
+# Engine flags shared by the async and sync engines
+_DB_ECHO = settings.DB_ECHO
+_DB_POOL_PRE_PING = settings.DB_POOL_PRE_PING
+_DB_POOL_USE_LIFO = settings.DB_POOL_USE_LIFO
+_DB_PGBOUNCER_TRANSACTION_MODE = settings.DB_PGBOUNCER_TRANSACTION_MODE
+
 # Create a Base class for declarative models
 Base = declarative_base()
 
 
+@lru_cache(maxsize=1)
 def get_database_url() -> str:
     """Get the appropriate database URL based on environment."""
     if os.getenv("APP_ENV") == "test":
@@ -21,6 +32,7 @@ def get_database_url() -> str:
         return str(settings.DATABASE_URL)
 
 
+@lru_cache(maxsize=1)
 def get_async_database_url() -> str:
     """Get the async database URL by adding async driver."""
     base_url = get_database_url()
@@ -35,6 +47,7 @@ def get_async_database_url() -> str:
         return base_url
 
 
+@lru_cache(maxsize=1)
 def get_sync_database_url() -> str:
     """Get the sync database URL by removing async driver."""
     base_url = get_database_url()
@@ -49,81 +62,143 @@ def get_sync_database_url() -> str:
         return base_url
 
 
+# Resolve the engine URLs once and reuse them below
+_ASYNC_URL = get_async_database_url()
+_SYNC_URL = get_sync_database_url()
+_IS_SQLITE_ASYNC = "sqlite" in _ASYNC_URL
+_IS_SQLITE_SYNC = "sqlite" in _SYNC_URL
+
+# Connection pooling for the async engine
+async_pool_options: Dict[str, Any]
+if _IS_SQLITE_ASYNC:
+    # SQLite keeps its default pool
+    async_pool_options = {}
+elif _DB_PGBOUNCER_TRANSACTION_MODE:
+    # PgBouncer already pools server connections; holding idle ones here would pin them
+    async_pool_options = {"poolclass": NullPool}
+else:
+    # Explicit connection pool sizing for server databases
+    async_pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_use_lifo": _DB_POOL_USE_LIFO,
+    }
+
+# Driver-specific connection arguments for the async engine
+async_connect_args: Dict[str, Any]
+if "asyncpg" in _ASYNC_URL and _DB_PGBOUNCER_TRANSACTION_MODE:
+    # Prepared statements do not survive PgBouncer transaction pooling, and it rejects
+    # unknown startup parameters, so both statement caches and server_settings are off
+    async_connect_args = {"prepared_statement_cache_size": 0, "statement_cache_size": 0}
+elif "asyncpg" in _ASYNC_URL:
+    # Disable PostgreSQL JIT so asyncpg's type introspection queries stay fast on new connections,
+    # and keep a per-connection cache of prepared statements for repeated queries
+    async_connect_args = {
+        "server_settings": {"jit": "off", "application_name": settings.PROJECT_NAME},
+        "prepared_statement_cache_size": 100,
+    }
+elif _IS_SQLITE_ASYNC:
+    # SQLite-specific settings for testing
+    async_connect_args = {"check_same_thread": False}
+else:
+    async_connect_args = {}
+
 # Create the SQLAlchemy async engine
 async_engine = create_async_engine(
-    get_async_database_url(),
-    echo=settings.DB_ECHO,
-    pool_pre_ping=True,
-    # SQLite-specific settings for testing
-    connect_args={"check_same_thread": False} if "sqlite" in get_async_database_url() else {},
+    _ASYNC_URL,
+    echo=_DB_ECHO,
+    pool_pre_ping=_DB_POOL_PRE_PING,
+    connect_args=async_connect_args,
+    **async_pool_options,
 )
 
+# LIFO checkout for the sync engine pool as well (SQLite does not use a queue pool)
+sync_pool_options: Dict[str, Any] = {} if _IS_SQLITE_SYNC else {"pool_use_lifo": _DB_POOL_USE_LIFO}
+
 # Create the SQLAlchemy sync engine for migrations
 sync_engine = create_engine(
-    get_sync_database_url(),
-    echo=settings.DB_ECHO,
-    pool_pre_ping=True,
+    _SYNC_URL,
+    echo=_DB_ECHO,
+    pool_pre_ping=_DB_POOL_PRE_PING,
     # SQLite-specific settings for testing
-    connect_args={"check_same_thread": False} if "sqlite" in get_sync_database_url() else {},
+    connect_args={"check_same_thread": False} if _IS_SQLITE_SYNC else {},
+    **sync_pool_options,
 )
 
 # For backward compatibility, keep 'engine' as async
 engine = async_engine
 
 
-# Create an async SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=async_engine, class_=AsyncSession)
+async def warmup_pool(n: int) -> None:
+    """
+    Open and release n connections concurrently so the pool starts populated.
 
-# Create a sync SessionLocal class for migrations
-SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+    Args:
+        n: Number of connections to establish
+    """
+    if isinstance(async_engine.pool, NullPool):
+        # Nothing is kept open between checkouts, so there is no pool to warm
+        return
 
+    async def _open_connection() -> None:
+        async with async_engine.connect():
+            pass
 
-# Async context manager for database sessions
-class AsyncDBSession:
-    """Async context manager for database sessions."""
+    await asyncio.gather(*(_open_connection() for _ in range(n)))
 
-    def __init__(self) -> None:
-        self.session: Optional[AsyncSession] = None
 
-    async def __aenter__(self) -> AsyncSession:
-        self.session = SessionLocal()
-        return self.session
+# Create an async session factory; objects stay loaded after commit so that
+# serializing them does not trigger a refresh query
+async_session_factory = async_sessionmaker(async_engine, expire_on_commit=False, autoflush=False)
 
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if self.session:
-            await self.session.close()
+# Request-scoped async sessions: every coroutine of the same asyncio task shares one session
+SessionLocal = async_scoped_session(async_session_factory, scopefunc=asyncio.current_task)
 
+# Create a sync SessionLocal class for migrations
+SyncSessionLocal = sessionmaker(autoflush=False, bind=sync_engine)
 
-# Convenience function for async database operations
-def get_async_db() -> AsyncDBSession:
+
+# Async context manager for database operations
+@asynccontextmanager
+async def get_async_db() -> AsyncIterator[AsyncSession]:
     """Get an async database session context manager."""
-    return AsyncDBSession()
+    session = async_session_factory()
+    try:
+        yield session
+    finally:
+        await session.close()
 
 
 # Async dependency to get DB session (for FastAPI dependency injection)
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """FastAPI dependency for getting database session."""
-    async with AsyncDBSession() as session:
-        yield session
+    """
+    FastAPI dependency for getting the request-scoped database session.
 
+    The session is created on first use and reused for the rest of the request.
+    It is closed here once the request is done, and DBSessionMiddleware closes it
+    again as a safety net for sessions opened outside this dependency; closing
+    twice is a no-op.
+    """
+    try:
+        yield SessionLocal()
+    finally:
+        await close_request_session()
 
-# Sync context manager for database sessions
-class SyncDBSession:
-    """Context manager for sync database sessions."""
 
-    def __init__(self) -> None:
-        self.session: Optional[Session] = None
+async def close_request_session() -> None:
+    """Close and discard the request-scoped database session, if one was opened."""
+    await SessionLocal.remove()
 
-    def __enter__(self) -> Session:
-        self.session = SyncSessionLocal()
-        return self.session
 
-    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if self.session:
-            self.session.close()
-
-
-# Convenience function for sync database operations
-def get_sync_db() -> SyncDBSession:
+# Sync context manager for database operations
+@contextmanager
+def get_sync_db() -> Iterator[Session]:
     """Get a sync database session context manager."""
-    return SyncDBSession()
+    session = SyncSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
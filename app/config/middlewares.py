@@ -1,57 +1,88 @@
-from typing import Any, List
+import re
+import sys
+from typing import Any, FrozenSet, Iterable, Pattern, Set, Tuple
 
 from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
+from app.config.custom_router import PATH_PARAM_PATTERN, PATH_PARAM_REGEX, path_to_regex
 from app.middlewares.auth_middleware import AuthMiddleware
 from app.middlewares.context_middleware import RequestContextMiddleware
+from app.middlewares.db_session_middleware import DBSessionMiddleware
 from app.middlewares.language_middleware import LanguageDetectionMiddleware
 from app.middlewares.logging_middleware import LoggingMiddleware
 
 
-def collect_protected_routes(api_router: Any) -> List[str]:
+def collect_protected_routes(api_router: Any) -> Tuple[FrozenSet[str], Tuple[str, ...], Pattern[str]]:
     """
     Collect all protected route patterns from the API router.
 
-    This function traverses the router tree to find all routes that require authentication
-    and returns their patterns for use by the AuthMiddleware.
+    The custom router flattens protected patterns into the top-level router as
+    sub-routers are included, so no traversal of the router tree is needed here.
+    Static paths (no path parameters) are returned as a set for exact lookups and
+    the regex sources of parameterized paths are compiled into a single regular expression.
+    The literal prefixes of the parameterized paths are returned as well, so most
+    paths can be ruled out with str.startswith before the regex is tried.
 
     Args:
         api_router: The main API router to collect routes from
 
     Returns:
-        List of route patterns that require authentication
+        Tuple of (static protected paths, literal prefixes of dynamic protected routes,
+        compiled pattern for dynamic protected routes)
     """
-    protected_routes: List[str] = []
+    static_paths: Set[str] = set(getattr(api_router, "protected_static", ()))
+    regex_sources: Set[str] = set(getattr(api_router, "protected_dynamic", ()))
 
-    def collect_from_router(router: Any, prefix: str = "") -> None:
-        """Collect protected routes using router flags and recorded protected prefixes."""
-        current_prefix = prefix + (getattr(router, "prefix", "") or "")
+    # A top-level router marked as requiring auth protects all of its own routes
+    if getattr(api_router, "requires_auth", False):
+        for route in getattr(api_router, "routes", []):
+            if hasattr(route, "path"):
+                if PATH_PARAM_PATTERN.search(route.path) is None:
+                    static_paths.add(sys.intern(route.path))
+                else:
+                    regex_sources.add(path_to_regex(route.path))
 
-        # 1) If this router is marked as requiring auth, mark all its routes
-        if getattr(router, "requires_auth", False):
-            for route in getattr(router, "routes", []):
-                if hasattr(route, "path"):
-                    route_path = current_prefix + route.path
-                    pattern = route_path.replace("{", "*").replace("}", "*")
-                    protected_routes.append(pattern)
+    dynamic_prefixes = tuple(sorted({literal_prefix(regex_source) for regex_source in regex_sources}))
 
-        # 2) Use any explicit protected patterns recorded by the custom router during includes
-        protected_patterns = getattr(router, "protected_patterns", [])
-        if protected_patterns:
-            protected_routes.extend(protected_patterns)
+    return frozenset(static_paths), dynamic_prefixes, compile_protected_routes(sorted(regex_sources))
 
-        # 3) Best-effort recursion if any nested routers exist
-        for route in getattr(router, "routes", []):
-            nested_router = getattr(route, "router", None)
-            if nested_router and hasattr(nested_router, "routes"):
-                sub_prefix = current_prefix + (getattr(route, "path", "") or "")
-                collect_from_router(nested_router, sub_prefix)
 
-    # Start collecting from the main API router
-    collect_from_router(api_router)
+def literal_prefix(regex_source: str) -> str:
+    """
+    Get the literal path prefix of a route regex source, up to its first path parameter.
+
+    Args:
+        regex_source: Regex source produced by path_to_regex
+
+    Returns:
+        The unescaped literal text preceding the first path parameter
+    """
+    escaped_prefix = regex_source.split(PATH_PARAM_REGEX, 1)[0]
+    return re.sub(r"\\(.)", r"\1", escaped_prefix, flags=re.DOTALL)
+
+
+def compile_protected_routes(regex_sources: Iterable[str]) -> Pattern[str]:
+    """
+    Compile protected route regex sources into a single anchored regular expression.
 
-    return protected_routes
+    The sources are produced by path_to_regex when routes are included, so path
+    parameters already match exactly one path segment. Compiling once at startup
+    lets AuthMiddleware check a request path with a single regex match.
+
+    Args:
+        regex_sources: Regex sources collected by collect_protected_routes
+
+    Returns:
+        Compiled pattern matching any protected path
+    """
+    alternatives = list(dict.fromkeys(regex_sources))
+
+    if not alternatives:
+        # Nothing is protected: use a pattern that never matches
+        return re.compile(r"(?!)")
+
+    return re.compile("^(?:" + "|".join(alternatives) + ")$")
 
 
 def setup_middlewares(app: FastAPI, api_router: Any) -> None:
@@ -66,12 +97,18 @@ def setup_middlewares(app: FastAPI, api_router: Any) -> None:
     )
 
     # Add other middlewares here
+    app.add_middleware(DBSessionMiddleware)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(RequestContextMiddleware)
     app.add_middleware(LanguageDetectionMiddleware)
 
     # Collect protected routes and add auth middleware
-    protected_routes = collect_protected_routes(api_router)
-    app.add_middleware(AuthMiddleware, protected_routes=protected_routes)
+    protected_paths, protected_prefixes, protected_routes = collect_protected_routes(api_router)
+    app.add_middleware(
+        AuthMiddleware,
+        protected_routes=protected_routes,
+        protected_paths=protected_paths,
+        protected_prefixes=protected_prefixes,
+    )
 
     return None
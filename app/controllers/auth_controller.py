@@ -2,10 +2,11 @@ from datetime import timedelta
 from typing import Dict
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config.database import get_db
+from app.config.database import get_async_db, get_db
 from app.config.settings import settings
 from app.models.user import User
 from app.schemas.common import ResponseBuilder, SuccessResponse
@@ -24,12 +25,15 @@ from app.utils.i18n import __
 from app.utils.tracing import get_trace_logger
 
 # Public router for authentication endpoints that don't require auth
-public_router = APIRouter()
+public_router = APIRouter(default_response_class=ORJSONResponse)
 # Protected router for endpoints that require authentication
-protected_router = APIRouter()
+protected_router = APIRouter(default_response_class=ORJSONResponse)
 
 logger = get_trace_logger("auth-controller")
 
+# Lifetime of issued access tokens
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+
 
 @public_router.post("/token")  # type: ignore[misc]
 async def login_for_access_token(
@@ -45,16 +49,16 @@ async def login_for_access_token(
     user = await user_service.authenticate_user(db=db, username=form_data.username, password=form_data.password)
 
     if not user:
-        logger.warning(f"Failed login attempt for user: {form_data.username}")
+        logger.warning("Failed login attempt for user: {}", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=__("auth.login_failed"),
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Check if user is active
-    if not user.is_active:
-        logger.warning(f"Login attempt for inactive user: {form_data.username}")
+    # Check if user is active (not soft-deleted)
+    if user.deleted_at is not None:
+        logger.warning("Login attempt for inactive user: {}", form_data.username)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=__("auth.login_inactive_user"),
@@ -62,10 +66,9 @@ async def login_for_access_token(
         )
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.username}, expires_delta=access_token_expires)
+    access_token = create_access_token(data={"sub": user.username}, expires_delta=ACCESS_TOKEN_EXPIRES)
 
-    logger.info(f"User {form_data.username} logged in successfully")
+    logger.info("User {} logged in successfully", form_data.username)
 
     return ResponseBuilder.success(
         message=__("auth.login_success"), data={"access_token": access_token, "token_type": "bearer"}
@@ -80,7 +83,7 @@ async def register(
     """
     Register a new user
     """
-    logger.info(f"User registration attempt: {user_data.username}")
+    logger.info("User registration attempt: {}", user_data.username)
 
     # Convert request schema to internal schema
     internal_user_data = convert_user_registration_to_internal(user_data)
@@ -92,10 +95,9 @@ async def register(
     )
 
     # Create access token
-    access_token_expires = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.username}, expires_delta=access_token_expires)
+    access_token = create_access_token(data={"sub": user.username}, expires_delta=ACCESS_TOKEN_EXPIRES)
 
-    logger.info(f"User {user_data.username} registered successfully")
+    logger.info("User {} registered successfully", user_data.username)
 
     return ResponseBuilder.success(
         message=__("auth.register_success"), data={"access_token": access_token, "token_type": "bearer"}
@@ -107,7 +109,6 @@ async def register(
 )  # type: ignore[misc]
 async def verify_firebase_token(
     request: FirebaseTokenVerifyRequest,
-    db: AsyncSession = Depends(get_db),
 ) -> SuccessResponse[FirebaseTokenVerifyResponse]:
     """
     Verify Firebase ID token and return JWT access token
@@ -121,26 +122,27 @@ async def verify_firebase_token(
     """
     logger.info("Firebase token verification attempt")
 
-    # Verify Firebase token
+    # Verify Firebase token (no database session is held during this network call)
     firebase_user = await firebase_service.verify_firebase_token(request.firebase_token)
 
-    # Get or create user from Firebase data
-    user, is_new_user = await user_service.get_or_create_firebase_user(
-        db=db,
-        firebase_uid=firebase_user["uid"],
-        email=firebase_user.get("email"),
-        phone_number=firebase_user.get("phone_number"),
-        name=firebase_user.get("name"),
-        picture=firebase_user.get("picture"),
-    )
+    # Get or create user from Firebase data, holding a session only for the lookup
+    async with get_async_db() as db:
+        user, is_new_user = await user_service.get_or_create_firebase_user(
+            db=db,
+            firebase_uid=firebase_user["uid"],
+            email=firebase_user.get("email"),
+            phone_number=firebase_user.get("phone_number"),
+            name=firebase_user.get("name"),
+            picture=firebase_user.get("picture"),
+        )
 
     # Create JWT access token
-    access_token_expires = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(data={"sub": user.username}, expires_delta=access_token_expires)
+    access_token = create_access_token(data={"sub": user.username}, expires_delta=ACCESS_TOKEN_EXPIRES)
 
     logger.info(
-        f"Firebase token verified successfully. User: {user.email or user.phone_number}, "
-        f"{'Registered' if is_new_user else 'Logged in'}"
+        "Firebase token verified successfully. User: {}, {}",
+        user.email or user.phone_number,
+        "Registered" if is_new_user else "Logged in",
     )
 
     response_data = FirebaseTokenVerifyResponse(
@@ -166,18 +168,9 @@ async def get_user_profile(
     """
     Get current user profile
     """
-    logger.info(f"User {current_user.username} requested profile")
-
-    user_profile = UserProfileResponse(
-        id=current_user.id,
-        username=current_user.username,
-        email=current_user.email,
-        full_name=current_user.full_name,
-        is_superuser=current_user.is_superuser,
-        created_at=current_user.created_at,
-        updated_at=current_user.updated_at,
-        deleted_at=current_user.deleted_at,
-    )
+    logger.info("User {} requested profile", current_user.username)
+
+    user_profile = UserProfileResponse.model_validate(current_user)
 
     return ResponseBuilder.success(message=__("auth.profile_retrieved"), data=user_profile)
 
@@ -191,7 +184,7 @@ async def update_user_profile(
     """
     Update user profile with optimistic locking
     """
-    logger.info(f"User {current_user.username} updating profile")
+    logger.info("User {} updating profile", current_user.username)
 
     # Convert request schema to internal schema
     internal_update_data = convert_user_update_request_to_internal(user_update)
@@ -200,22 +193,13 @@ async def update_user_profile(
     updated_user = await user_service.update_user_with_optimistic_lock(
         db=db,
         user_id=current_user.id,
-        update_data=internal_update_data.dict(exclude_unset=True),
+        update_data=internal_update_data.model_dump(exclude_unset=True),
         expected_updated_at=internal_update_data.updated_at,
     )
 
-    logger.info(f"User {current_user.username} profile updated successfully")
-
-    user_profile = UserProfileResponse(
-        id=updated_user.id,
-        username=updated_user.username,
-        email=updated_user.email,
-        full_name=updated_user.full_name,
-        is_superuser=updated_user.is_superuser,
-        created_at=updated_user.created_at,
-        updated_at=updated_user.updated_at,
-        deleted_at=updated_user.deleted_at,
-    )
+    logger.info("User {} profile updated successfully", current_user.username)
+
+    user_profile = UserProfileResponse.model_validate(updated_user)
 
     return ResponseBuilder.success(
         message=__("auth.profile_updated"),
@@ -1,27 +1,59 @@
+from datetime import datetime
 from typing import Any, Dict
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.database import get_db
+from app.middlewares.language_middleware import get_current_language
 from app.schemas.common import ResponseBuilder, SuccessResponse
-from app.utils.i18n import __
+from app.utils.i18n import __, get_message
 from app.utils.tracing import get_trace_logger
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = get_trace_logger("health-controller")
 
+# Connectivity probe statement, built once and reused by every /health/db call
+_PING = text("SELECT 1")
+
+# Pre-serialized /health bodies per language, up to the opening quote of the timestamp
+_health_body_prefixes: Dict[str, bytes] = {}
+
+
+def _get_health_body_prefix(language: str) -> bytes:
+    """
+    Get the serialized /health body for a language, without its timestamp
+
+    Args:
+        language: Language code for the response message
+
+    Returns:
+        JSON bytes ending with the opening quote of the timestamp value
+    """
+    prefix = _health_body_prefixes.get(language)
+    if prefix is None:
+        body = ResponseBuilder.success(
+            message=get_message("health.service_running", language), data={"status": "ok"}
+        ).model_dump(mode="json", exclude={"timestamp"})
+        prefix = orjson.dumps(body)[:-1] + b',"timestamp":"'
+        _health_body_prefixes[language] = prefix
+    return prefix
+
 
 @router.get("/health", response_model=SuccessResponse[Dict[str, Any]])  # type: ignore[misc]
-def health_check() -> SuccessResponse[Dict[str, Any]]:
+async def health_check(request: Request) -> Response:
     """
     Health check endpoint for the API
 
-    Returns a simple response to indicate the API is running.
+    Returns a simple response to indicate the API is running. The body is
+    pre-serialized per language; only the timestamp is filled in per request.
     """
     logger.debug("Health check called")
-    return ResponseBuilder.success(message=__("health.service_running"), data={"status": "ok"})
+    body = _get_health_body_prefix(get_current_language(request)) + datetime.utcnow().isoformat().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/health/db", response_model=SuccessResponse[Dict[str, Any]])  # type: ignore[misc]
@@ -34,7 +66,7 @@ async def db_health_check(db: AsyncSession = Depends(get_db)) -> SuccessResponse
     logger.debug("Database health check called")
 
     # Execute a simple query to check DB connection
-    await db.execute(text("SELECT 1"))
+    await db.execute(_PING)
 
     logger.info("Database health check successful")
     return ResponseBuilder.success(message=__("health.database_healthy"), data={"status": "ok"})
@@ -5,7 +5,12 @@ This controller manages language switching and provides information about
 supported languages in the application.
 """
 
-from fastapi import APIRouter
+import hashlib
+from functools import lru_cache
+from typing import Dict, List
+
+from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.exceptions import ValidationException
 from app.middlewares.language_middleware import get_current_language, set_current_language
@@ -16,62 +21,145 @@ from app.schemas.languages import (
     LanguageInfo,
     SupportedLanguagesResponse,
 )
-from app.utils.i18n import __, get_supported_languages, is_language_supported
+from app.utils.i18n import (
+    __,
+    get_message,
+    get_supported_languages,
+    is_language_supported,
+    register_cache_clear_callback,
+)
 from app.utils.tracing import get_trace_logger
 
 # Create router
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Initialize logger
 logger = get_trace_logger("language-controller")
 
+# Map language codes to their display names
+LANGUAGE_NAMES = {
+    "en": {"name": "English", "native_name": "English"},
+    "jp": {"name": "Japanese", "native_name": "日本語"},
+}
+
+# Supported-language metadata only changes on deploy, so clients may reuse it for an hour
+SUPPORTED_LANGUAGES_CACHE_CONTROL = "public, max-age=3600"
+
+# The response depends on the language detected from the query, header or cookie
+SUPPORTED_LANGUAGES_VARY = "Accept-Language, Cookie"
+
 
-@router.get("/supported", response_model=SuccessResponse[SupportedLanguagesResponse])  # type: ignore[misc]
-async def get_supported_languages_endpoint() -> SuccessResponse[SupportedLanguagesResponse]:
+@lru_cache(maxsize=1)
+def _build_supported_languages() -> List[LanguageInfo]:
     """
-    Get list of supported languages with their information.
+    Build the language information list once; the supported languages and their
+    display names do not depend on the request or the current locale.
 
     Returns:
-        SuccessResponse containing supported languages and current language info
+        List of LanguageInfo for every supported language
     """
-    logger.info("Retrieving supported languages")
-
-    # Get supported languages with their details
     supported_languages = []
     for lang_code in get_supported_languages():
-        # Map language codes to their display names
-        lang_names = {
-            "en": {"name": "English", "native_name": "English"},
-            "jp": {"name": "Japanese", "native_name": "日本語"},
-        }
-
-        lang_info = lang_names.get(lang_code, {"name": lang_code.upper(), "native_name": lang_code.upper()})
+        lang_info = LANGUAGE_NAMES.get(lang_code, {"name": lang_code.upper(), "native_name": lang_code.upper()})
 
         supported_languages.append(
-            LanguageInfo(
+            LanguageInfo.model_construct(
                 code=lang_code,
                 name=lang_info["name"],
                 native_name=lang_info["native_name"],
             )
         )
 
-    response_data = SupportedLanguagesResponse(
-        supported_languages=supported_languages,
-        current_language=get_current_language(),
+    return supported_languages
+
+
+@lru_cache(maxsize=8)
+def _supported_languages_etag(language: str) -> str:
+    """
+    Build a weak ETag for the supported languages response in the given language.
+
+    The response body carries a timestamp, so the tag identifies the content
+    (supported languages, current language and translated messages) rather than
+    the exact bytes. The cache is cleared whenever translations are reloaded.
+
+    Args:
+        language: Current language code
+
+    Returns:
+        Weak ETag header value
+    """
+    content = repr(
+        (
+            tuple(get_supported_languages()),
+            language,
+            get_message("language.current", language),
+            get_message("language.supported_retrieved", language),
+        )
+    ).encode()
+    return f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+register_cache_clear_callback(_supported_languages_etag.cache_clear)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque_tag for candidate in if_none_match.split(","))
+
+
+@router.get(
+    "/supported",
+    response_model=None,
+    responses={status.HTTP_200_OK: {"model": SuccessResponse[SupportedLanguagesResponse]}},
+)  # type: ignore[misc]
+async def get_supported_languages_endpoint(request: Request) -> Response:
+    """
+    Get list of supported languages with their information.
+
+    The response is cacheable and carries an ETag; a matching If-None-Match
+    request is answered with 304 Not Modified without building the body.
+
+    Returns:
+        Response containing supported languages and current language info
+    """
+    current_language = get_current_language(request)
+    cache_headers: Dict[str, str] = {
+        "Cache-Control": SUPPORTED_LANGUAGES_CACHE_CONTROL,
+        "ETag": _supported_languages_etag(current_language),
+        "Vary": SUPPORTED_LANGUAGES_VARY,
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and _etag_matches(if_none_match, cache_headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+
+    logger.info("Retrieving supported languages")
+
+    # All fields come from trusted static data, so skip validation here and serialize
+    # the response directly instead of re-validating it against a response_model
+    response_data = SupportedLanguagesResponse.model_construct(
+        supported_languages=_build_supported_languages(),
+        current_language=current_language,
         message=__("language.current"),
     )
+    body = ResponseBuilder.success(message=__("language.supported_retrieved"), data=response_data)
 
-    return ResponseBuilder.success(message=__("language.supported_retrieved"), data=response_data)
+    return ORJSONResponse(content=body.model_dump(), headers=cache_headers)
 
 
 @router.post("/change", response_model=SuccessResponse[ChangeLanguageResponse])  # type: ignore[misc]
 async def change_language(
+    request: Request,
     language_request: ChangeLanguageRequest,
 ) -> SuccessResponse[ChangeLanguageResponse]:
     """
     Change the current application language.
 
     Args:
+        request: The incoming request
         language_request: Language change request data
 
     Returns:
@@ -82,10 +170,10 @@ async def change_language(
     """
     language = language_request.language
 
-    logger.info(f"Language change requested to: {language}")
+    logger.info("Language change requested to: {}", language)
 
     if not is_language_supported(language):
-        logger.warning(f"Unsupported language requested: {language}")
+        logger.warning("Unsupported language requested: {}", language)
         raise ValidationException(
             message=__("language.not_supported"),
             details={
@@ -94,10 +182,10 @@ async def change_language(
             },
         )
 
-    # Set the language in context
-    set_current_language(language)
+    # Set the language in context and in the request state
+    request.state.language = set_current_language(language)
 
-    logger.info(f"Language successfully changed to: {language}")
+    logger.info("Language successfully changed to: {}", language)
 
     response_data = ChangeLanguageResponse(language=language, message=__("language.changed"))
 
@@ -1,9 +1,11 @@
-from typing import Any, List, Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config.constants import MAX_PAGE_SIZE
 from app.config.database import get_db
+from app.models.user import User
 from app.schemas.common import ResponseBuilder, SuccessResponse
 from app.schemas.posts import (
     PostCreateRequest,
@@ -14,7 +16,7 @@ from app.schemas.posts import (
     convert_post_update_request_to_internal,
 )
 from app.services.post_service import PostService
-from app.utils.auth import get_current_user
+from app.utils.auth import get_current_user, get_current_username
 from app.utils.i18n import __
 from app.utils.tracing import get_trace_logger
 
@@ -28,7 +30,7 @@ logger = get_trace_logger("post-controller")
     "/", response_model=SuccessResponse[PostResponse], status_code=status.HTTP_201_CREATED
 )  # type: ignore[misc]
 async def create_post(
-    *, db: AsyncSession = Depends(get_db), post_in: PostCreateRequest, current_user: Any = Depends(get_current_user)
+    *, db: AsyncSession = Depends(get_db), post_in: PostCreateRequest, current_user: User = Depends(get_current_user)
 ) -> SuccessResponse[PostResponse]:
     """
     Create a new post with nested relationships.
@@ -51,7 +53,7 @@ async def create_post(
         post_data=internal_post_data,
     )
 
-    logger.info(f"Post created successfully with ID: {post.id}")
+    logger.info("Post created successfully with ID: {}", post.id)
 
     # Convert model to response schema
     post_response = convert_post_model_to_response(post)
@@ -61,17 +63,21 @@ async def create_post(
 
 @router.get("/", response_model=SuccessResponse[List[PostResponse]])  # type: ignore[misc]
 async def get_posts(
-    *, db: AsyncSession = Depends(get_db), skip: int = 0, limit: int = 100, search: Optional[str] = None
+    *,
+    db: AsyncSession = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    search: Optional[str] = None,
 ) -> SuccessResponse[List[PostResponse]]:
     """
     Get posts with optional search.
 
     Supports:
-    - Pagination
+    - Pagination (at most MAX_PAGE_SIZE posts per page)
     - Search by title
     - Relationship loading
     """
-    logger.info(f"Retrieving posts - skip: {skip}, limit: {limit}, search: {search}")
+    logger.info("Retrieving posts - skip: {}, limit: {}, search: {}", skip, limit, search)
 
     post_service = PostService()
 
@@ -80,10 +86,10 @@ async def get_posts(
     else:
         posts = await post_service.get_all(db=db, skip=skip, limit=limit)
 
-    logger.info(f"Retrieved {len(posts)} posts")
+    logger.info("Retrieved {} posts", len(posts))
 
     # Convert models to response schemas
-    posts_response = [convert_post_model_to_response(post) for post in posts]
+    posts_response = list(map(convert_post_model_to_response, posts))
 
     return ResponseBuilder.success(message=__("general.operation_successful"), data=posts_response)
 
@@ -100,7 +106,7 @@ async def get_post(
     - Loading comments (one-to-many)
     - Multi-level nested relationships
     """
-    logger.info(f"Retrieving post with ID: {post_id}")
+    logger.info("Retrieving post with ID: {}", post_id)
 
     post_service = PostService()
 
@@ -109,10 +115,10 @@ async def get_post(
     )
 
     if not post:
-        logger.warning(f"Post not found with ID: {post_id}")
+        logger.warning("Post not found with ID: {}", post_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=__("general.not_found"))
 
-    logger.info(f"Post retrieved successfully: {post_id}")
+    logger.info("Post retrieved successfully: {}", post_id)
 
     # Convert model to response schema
     post_response = convert_post_model_to_response(post)
@@ -126,7 +132,7 @@ async def update_post(
     db: AsyncSession = Depends(get_db),
     post_id: str,
     post_in: PostUpdateRequest,
-    current_user: Any = Depends(get_current_user),
+    username: str = Depends(get_current_username),
 ) -> SuccessResponse[PostResponse]:
     """
     Update a post with nested relationships and optimistic locking.
@@ -137,7 +143,7 @@ async def update_post(
     - Managing comments (one-to-many)
     - Optimistic locking with updated_at
     """
-    logger.info(f"Updating post with ID: {post_id}")
+    logger.info("Updating post with ID: {} by user: {}", post_id, username)
 
     post_service = PostService()
 
@@ -152,10 +158,10 @@ async def update_post(
     )
 
     if not post:
-        logger.warning(f"Post not found for update with ID: {post_id}")
+        logger.warning("Post not found for update with ID: {}", post_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=__("general.not_found"))
 
-    logger.info(f"Post updated successfully: {post_id}")
+    logger.info("Post updated successfully: {}", post_id)
 
     # Convert model to response schema
     post_response = convert_post_model_to_response(post)
@@ -168,7 +174,7 @@ async def delete_post(
     *,
     db: AsyncSession = Depends(get_db),
     post_id: str,
-    current_user: Any = Depends(get_current_user),
+    username: str = Depends(get_current_username),
     hard_delete: bool = False,
 ) -> SuccessResponse[None]:
     """
@@ -179,7 +185,7 @@ async def delete_post(
     - Hard delete with cascade
     - Relationship cleanup
     """
-    logger.info(f"Deleting post with ID: {post_id}, hard_delete: {hard_delete}")
+    logger.info("Deleting post with ID: {}, hard_delete: {}, by user: {}", post_id, hard_delete, username)
 
     post_service = PostService()
 
@@ -187,10 +193,10 @@ async def delete_post(
     post = await post_service.delete(db=db, id=post_id, hard_delete=hard_delete)
 
     if not post:
-        logger.warning(f"Post not found for deletion with ID: {post_id}")
+        logger.warning("Post not found for deletion with ID: {}", post_id)
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=__("general.not_found"))
 
-    logger.info(f"Post deleted successfully: {post_id}")
+    logger.info("Post deleted successfully: {}", post_id)
 
     # Return success response for deletion (no data needed)
     return ResponseBuilder.deleted(message=__("general.operation_successful"))
@@ -198,25 +204,29 @@ async def delete_post(
 
 @router.get("/author/{author_id}", response_model=SuccessResponse[List[PostResponse]])  # type: ignore[misc]
 async def get_posts_by_author(
-    *, db: AsyncSession = Depends(get_db), author_id: str, skip: int = 0, limit: int = 100
+    *,
+    db: AsyncSession = Depends(get_db),
+    author_id: str,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
 ) -> SuccessResponse[List[PostResponse]]:
     """
     Get posts by a specific author.
 
     Supports:
-    - Pagination
+    - Pagination (at most MAX_PAGE_SIZE posts per page)
     - Author filtering
     - Relationship loading
     """
-    logger.info(f"Retrieving posts by author: {author_id}, skip: {skip}, limit: {limit}")
+    logger.info("Retrieving posts by author: {}, skip: {}, limit: {}", author_id, skip, limit)
 
     post_service = PostService()
 
     posts = await post_service.get_posts_by_author(db=db, author_id=author_id, skip=skip, limit=limit)
 
-    logger.info(f"Retrieved {len(posts)} posts for author: {author_id}")
+    logger.info("Retrieved {} posts for author: {}", len(posts), author_id)
 
     # Convert models to response schemas
-    posts_response = [convert_post_model_to_response(post) for post in posts]
+    posts_response = list(map(convert_post_model_to_response, posts))
 
     return ResponseBuilder.success(message=__("general.operation_successful"), data=posts_response)
@@ -6,14 +6,21 @@ that can occur in the application, providing a consistent way to handle
 and communicate errors throughout the system.
 """
 
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 from fastapi import status
 
+# Shared read-only default for exceptions raised without details
+_NO_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
 
 class AppException(Exception):
     """Base exception for application-specific errors"""
 
+    # Slots keep BaseException from allocating an instance __dict__ for these attributes
+    __slots__ = ("message", "status_code", "details")
+
     def __init__(
         self,
         message: str,
@@ -22,13 +29,15 @@ class AppException(Exception):
     ):
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details: Mapping[str, Any] = details if details is not None else _NO_DETAILS
         super().__init__(self.message)
 
 
 class ValidationException(AppException):
     """Exception for validation errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, details=details)
 
@@ -36,6 +45,8 @@ class ValidationException(AppException):
 class NotFoundException(AppException):
     """Exception for resource not found errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_404_NOT_FOUND, details=details)
 
@@ -43,6 +54,8 @@ class NotFoundException(AppException):
 class ConflictException(AppException):
     """Exception for resource conflict errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_409_CONFLICT, details=details)
 
@@ -50,6 +63,8 @@ class ConflictException(AppException):
 class UnauthorizedException(AppException):
     """Exception for unauthorized access errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_401_UNAUTHORIZED, details=details)
 
@@ -57,6 +72,8 @@ class UnauthorizedException(AppException):
 class ForbiddenException(AppException):
     """Exception for forbidden access errors"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_403_FORBIDDEN, details=details)
 
@@ -64,6 +81,8 @@ class ForbiddenException(AppException):
 class OptimisticLockException(AppException):
     """Exception for optimistic locking conflicts"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_409_CONFLICT, details=details)
 
@@ -71,6 +90,8 @@ class OptimisticLockException(AppException):
 class TokenMissingException(UnauthorizedException):
     """Raised when an authentication token is missing"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, details=details)
 
@@ -78,6 +99,8 @@ class TokenMissingException(UnauthorizedException):
 class TokenExpiredException(UnauthorizedException):
     """Raised when an authentication token is expired"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, details=details)
 
@@ -85,6 +108,8 @@ class TokenExpiredException(UnauthorizedException):
 class TokenInvalidException(UnauthorizedException):
     """Raised when an authentication token is invalid"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, details=details)
 
@@ -92,5 +117,7 @@ class TokenInvalidException(UnauthorizedException):
 class InactiveUserException(AppException):
     """Raised when the current user is inactive"""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(message=message, status_code=status.HTTP_400_BAD_REQUEST, details=details)
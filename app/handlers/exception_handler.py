@@ -5,10 +5,10 @@ This module provides a single exception_handler(request, exc) function used by
 app.add_exception_handler to format errors consistently across the API.
 """
 
+import re
 import traceback
 
-from fastapi import HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import HTTPException, Request, Response
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm.exc import NoResultFound
 
@@ -19,14 +19,23 @@ from app.exceptions import (
     TokenMissingException,
     UnauthorizedException,
 )
-from app.schemas.common import ResponseBuilder
+from app.schemas.common import ErrorResponse, ResponseBuilder
 from app.utils.i18n import __
 from app.utils.logger import get_logger
 
 logger = get_logger("exception-handler")
 
+# Integrity error classification, matched case-insensitively against the driver message
+UNIQUE_VIOLATION_PATTERN = re.compile(r"unique constraint", re.IGNORECASE)
+FOREIGN_KEY_VIOLATION_PATTERN = re.compile(r"foreign key constraint", re.IGNORECASE)
 
-async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
+
+def _error_response(status_code: int, body: ErrorResponse) -> Response:
+    """Serialize an error body straight to JSON bytes in a single pass."""
+    return Response(content=body.model_dump_json(), status_code=status_code, media_type="application/json")
+
+
+async def exception_handler(request: Request, exc: Exception) -> Response:
     """
     Central exception handler.
 
@@ -39,7 +48,10 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
     # Pass through HTTPException (let FastAPI handle it normally)
     if isinstance(exc, HTTPException):
         logger.warning(
-            f"HTTP Exception [{request_id}]: {exc.status_code} - {exc.detail}",
+            "HTTP Exception [{}]: {} - {}",
+            request_id,
+            exc.status_code,
+            exc.detail,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -56,7 +68,10 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
             exc, (UnauthorizedException, TokenExpiredException, TokenInvalidException, TokenMissingException)
         ):
             logger.debug(
-                f"Auth Exception [{request_id}]: {exc.status_code} - {exc.message}",
+                "Auth Exception [{}]: {} - {}",
+                request_id,
+                exc.status_code,
+                exc.message,
                 extra={
                     "request_id": request_id,
                     "method": method,
@@ -68,7 +83,10 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
             )
         else:
             logger.debug(
-                f"Application Exception [{request_id}]: {exc.status_code} - {exc.message}",
+                "Application Exception [{}]: {} - {}",
+                request_id,
+                exc.status_code,
+                exc.message,
                 extra={
                     "request_id": request_id,
                     "method": method,
@@ -79,17 +97,19 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
                 },
             )
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content=ResponseBuilder.error(
+        return _error_response(
+            exc.status_code,
+            ResponseBuilder.error(
                 message=exc.message, code=exc.status_code, details=exc.details, request_id=request_id
-            ).model_dump(mode="json"),
+            ),
         )
 
     # SQLAlchemy integrity violations
     if isinstance(exc, IntegrityError):
         logger.error(
-            f"Database Integrity Error [{request_id}]: {str(exc)}",
+            "Database Integrity Error [{}]: {}",
+            request_id,
+            exc,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -100,38 +120,40 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
         )
 
         error_message = str(exc.orig) if hasattr(exc, "orig") else str(exc)
-        if "unique constraint" in error_message.lower():
-            return JSONResponse(
-                status_code=409,
-                content=ResponseBuilder.conflict(
+        if UNIQUE_VIOLATION_PATTERN.search(error_message):
+            return _error_response(
+                409,
+                ResponseBuilder.conflict(
                     message=__("general.resource_already_exists"),
                     details={"constraint_violation": True},
                     request_id=request_id,
-                ).model_dump(mode="json"),
+                ),
             )
-        elif "foreign key constraint" in error_message.lower():
-            return JSONResponse(
-                status_code=422,
-                content=ResponseBuilder.validation_error(
+        elif FOREIGN_KEY_VIOLATION_PATTERN.search(error_message):
+            return _error_response(
+                422,
+                ResponseBuilder.validation_error(
                     message=__("general.invalid_reference"),
                     details={"foreign_key_violation": True},
                     request_id=request_id,
-                ).model_dump(mode="json"),
+                ),
             )
         else:
-            return JSONResponse(
-                status_code=422,
-                content=ResponseBuilder.validation_error(
+            return _error_response(
+                422,
+                ResponseBuilder.validation_error(
                     message=__("general.database_constraint_error"),
                     details={"constraint_error": True},
                     request_id=request_id,
-                ).model_dump(mode="json"),
+                ),
             )
 
     # Not found from ORM
     if isinstance(exc, NoResultFound):
         logger.warning(
-            f"Resource Not Found [{request_id}]: {str(exc)}",
+            "Resource Not Found [{}]: {}",
+            request_id,
+            exc,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -141,17 +163,17 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
             },
         )
 
-        return JSONResponse(
-            status_code=404,
-            content=ResponseBuilder.not_found(message=__("general.not_found"), request_id=request_id).model_dump(
-                mode="json"
-            ),
+        return _error_response(
+            404,
+            ResponseBuilder.not_found(message=__("general.not_found"), request_id=request_id),
         )
 
     # Other SQLAlchemy errors
     if isinstance(exc, SQLAlchemyError):
         logger.error(
-            f"Database Error [{request_id}]: {str(exc)}",
+            "Database Error [{}]: {}",
+            request_id,
+            exc,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -161,17 +183,17 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
             },
         )
 
-        return JSONResponse(
-            status_code=500,
-            content=ResponseBuilder.internal_error(
-                message=__("general.database_error"), request_id=request_id
-            ).model_dump(mode="json"),
+        return _error_response(
+            500,
+            ResponseBuilder.internal_error(message=__("general.database_error"), request_id=request_id),
         )
 
     # Validation errors
     if isinstance(exc, ValueError):
         logger.warning(
-            f"Validation Error [{request_id}]: {str(exc)}",
+            "Validation Error [{}]: {}",
+            request_id,
+            exc,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -181,30 +203,31 @@ async def exception_handler(request: Request, exc: Exception) -> JSONResponse:
             },
         )
 
-        return JSONResponse(
-            status_code=422,
-            content=ResponseBuilder.validation_error(
+        return _error_response(
+            422,
+            ResponseBuilder.validation_error(
                 message=str(exc), details={"validation_error": True}, request_id=request_id
-            ).model_dump(mode="json"),
+            ),
         )
 
-    # Catch-all
+    # Catch-all: format the traceback once and reuse it for both log records
+    formatted_traceback = "".join(traceback.format_exception(type(exc), exc, exc.__traceback__))
     logger.error(
-        f"Unhandled Exception [{request_id}]: {str(exc)}",
+        "Unhandled Exception [{}]: {}",
+        request_id,
+        exc,
         extra={
             "request_id": request_id,
             "method": method,
             "url": url,
             "error_type": "unhandled_exception",
             "error_message": str(exc),
-            "traceback": traceback.format_exc(),
+            "traceback": formatted_traceback,
         },
     )
-    logger.error(f"Unhandled exception in request {request_id}: {traceback.format_exc()}")
+    logger.error("Unhandled exception in request {}: {}", request_id, formatted_traceback)
 
-    return JSONResponse(
-        status_code=500,
-        content=ResponseBuilder.internal_error(
-            message=__("general.unexpected_error"), request_id=request_id
-        ).model_dump(mode="json"),
+    return _error_response(
+        500,
+        ResponseBuilder.internal_error(message=__("general.unexpected_error"), request_id=request_id),
     )
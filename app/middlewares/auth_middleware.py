@@ -1,21 +1,58 @@
-import re
-from typing import Any, Callable, List, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import AbstractSet, Dict, Optional, Pattern, Tuple
 
+import orjson
 from fastapi import HTTPException, Request, Response, status
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.exceptions import AppException
-from app.schemas.common import ResponseBuilder
+from app.schemas.common import ErrorDetail, ResponseBuilder
 from app.utils.auth import decode_token
-from app.utils.i18n import __
+from app.utils.i18n import __, current_language, get_message
 from app.utils.request_context import get_request_id, set_current_user_data
 from app.utils.tracing import get_trace_logger
 
 logger = get_trace_logger("auth-middleware")
 
+# Upper bound on memoized per-path auth decisions for dynamic routes
+ROUTE_DECISION_CACHE_SIZE = 2048
 
-class AuthMiddleware(BaseHTTPMiddleware):
+# Pre-serialized "token missing" bodies per language, up to the request_id value
+_token_missing_body_prefixes: Dict[str, bytes] = {}
+
+# Remainder of an error body after the closing quote of its timestamp value
+_ERROR_BODY_SUFFIX = b'"},"success":false,"data":null}'
+
+
+def _get_token_missing_body(request_id: Optional[str]) -> bytes:
+    """
+    Get the 401 body for a protected request without a token
+
+    Everything but the request id and timestamp is serialized once per language.
+
+    Args:
+        request_id: Request ID for tracking
+
+    Returns:
+        JSON bytes matching ResponseBuilder.error(...).model_dump_json()
+    """
+    language = current_language.get()
+    prefix = _token_missing_body_prefixes.get(language)
+    if prefix is None:
+        detail = ErrorDetail(
+            message=get_message("auth.token_missing", language),
+            code=status.HTTP_401_UNAUTHORIZED,
+            details={"token_required": True},
+        )
+        detail_json = detail.model_dump_json(exclude={"request_id", "timestamp"}).encode()
+        prefix = b'{"error":' + detail_json[:-1] + b',"request_id":'
+        _token_missing_body_prefixes[language] = prefix
+    timestamp = datetime.utcnow().isoformat().encode()
+    return prefix + orjson.dumps(request_id) + b',"timestamp":"' + timestamp + _ERROR_BODY_SUFFIX
+
+
+class AuthMiddleware:
     """
     Authentication middleware that validates JWT tokens for protected routes.
 
@@ -28,94 +65,118 @@ class AuthMiddleware(BaseHTTPMiddleware):
     6. Allows public routes to pass through without token validation
     """
 
-    def __init__(self, app: ASGIApp, protected_routes: List[str]) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        protected_routes: Pattern[str],
+        protected_paths: AbstractSet[str] = frozenset(),
+        protected_prefixes: Tuple[str, ...] = ("",),
+    ) -> None:
         """
         Initialize the authentication middleware.
 
         Args:
             app: The ASGI application
-            protected_routes: List of route patterns that require authentication
+            protected_routes: Compiled pattern matching protected routes with path parameters
+            protected_paths: Static paths that require authentication (exact match)
+            protected_prefixes: Literal prefixes of the routes in protected_routes; paths
+                matching none of them skip the regex
         """
-        super().__init__(app)
+        self.app = app
         self.protected_routes = protected_routes
-        logger.debug(f"AuthMiddleware initialized with {len(protected_routes)} protected routes")
-        logger.debug(f"Protected routes: {protected_routes}")
-
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
+        self.protected_paths = protected_paths
+        self.protected_prefixes = protected_prefixes
+        # Memoize regex decisions per path, bounded so high-cardinality paths cannot grow it unchecked
+        self._match_protected_route = lru_cache(maxsize=ROUTE_DECISION_CACHE_SIZE)(self._match_protected_route)
+        logger.debug("AuthMiddleware initialized with {} static protected paths", len(protected_paths))
+        logger.debug("Protected route pattern: {}", protected_routes.pattern)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process the request and validate authentication for protected routes.
 
+        The route check runs before the inner application is awaited, so rejected
+        requests never reach the rest of the middleware stack.
+
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # CORS preflights and public routes pass straight through; the decision is made
+        # from the raw scope so no Request or URL object is built for them
+        if scope["method"] == "OPTIONS" or not self._requires_auth(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        response = self._authenticate(request)
+        if response is not None:
+            await response(scope, receive, send)
+            return
+
+        # Call the next middleware/endpoint
+        await self.app(scope, receive, send)
+
+    def _authenticate(self, request: Request) -> Optional[Response]:
+        """
+        Validate authentication for a request to a protected route.
+
         Args:
             request: The incoming request
-            call_next: The next middleware/endpoint in the chain
 
         Returns:
-            Response from the next middleware/endpoint
+            An error response if authentication failed, None if the request may proceed
         """
         request_id = get_request_id()
-        logger.debug(f"[{request_id}] AuthMiddleware: Processing request to {request.url.path}")
-
-        # Skip auth for CORS preflight requests
-        if request.method == "OPTIONS":
-            logger.debug(f"[{request_id}] AuthMiddleware: Skipping auth for OPTIONS request")
-            return await call_next(request)
-
-        # Check if the current route requires authentication
-        if self._requires_auth(request.url.path):
-            logger.debug(f"[{request_id}] AuthMiddleware: Route requires authentication")
-
-            # Extract token from Authorization header
-            token = self._extract_token(request)
-            if not token:
-                logger.info(f"[{request_id}] AuthMiddleware: No token provided for protected route")
-                return Response(
-                    content=ResponseBuilder.error(
-                        message=__("auth.token_missing"),
-                        code=status.HTTP_401_UNAUTHORIZED,
-                        details={"token_required": True},
-                        request_id=request_id,
-                    ).model_dump_json(),
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    media_type="application/json",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-
-            try:
-                # Validate token and decode payload
-                payload = decode_token(token)
-                logger.debug(f"[{request_id}] AuthMiddleware: Token validated successfully")
-
-                # Store decoded token data in request context
-                set_current_user_data(payload)
-                logger.debug(f"[{request_id}] AuthMiddleware: User data stored in context")
-
-            except AppException as e:
-                # Handle known auth errors locally to avoid noisy ExceptionGroup logs
-                logger.info(f"[{request_id}] Auth error: {e.message}")
-                return Response(
-                    content=ResponseBuilder.error(
-                        message=e.message,
-                        code=e.status_code,
-                        details=e.details,
-                        request_id=request_id,
-                    ).model_dump_json(),
-                    status_code=e.status_code,
-                    media_type="application/json",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            except Exception as e:
-                logger.error(f"[{request_id}] Auth error: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=__("auth.token_invalid"),
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-        else:
-            logger.debug(f"[{request_id}] AuthMiddleware: Route does not require authentication")
-
-        # Call the next middleware/endpoint
-        response = await call_next(request)
-        return response
+        logger.debug("[{}] AuthMiddleware: Route {} requires authentication", request_id, request.scope["path"])
+
+        # Extract token from Authorization header
+        token = self._extract_token(request)
+        if not token:
+            logger.info("[{}] AuthMiddleware: No token provided for protected route", request_id)
+            return Response(
+                content=_get_token_missing_body(request_id),
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                media_type="application/json",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        try:
+            # Validate token and decode payload
+            payload = decode_token(token)
+
+            # Store decoded token data in request context
+            set_current_user_data(payload)
+            logger.debug("[{}] AuthMiddleware: Token validated, user data stored in context", request_id)
+
+        except AppException as e:
+            # Handle known auth errors locally to avoid noisy ExceptionGroup logs
+            logger.info("[{}] Auth error: {}", request_id, e.message)
+            return Response(
+                content=ResponseBuilder.error(
+                    message=e.message,
+                    code=e.status_code,
+                    details=e.details,
+                    request_id=request_id,
+                ).model_dump_json(),
+                status_code=e.status_code,
+                media_type="application/json",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        except Exception as e:
+            logger.error("[{}] Auth error: {}", request_id, e)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=__("auth.token_invalid"),
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+
+        return None
 
     def _requires_auth(self, path: str) -> bool:
         """
@@ -127,38 +188,29 @@ class AuthMiddleware(BaseHTTPMiddleware):
         Returns:
             True if the path requires authentication, False otherwise
         """
-        for pattern in self.protected_routes:
-            if self._match_pattern(pattern, path):
-                return True
-        return False
-
-    def _match_pattern(self, pattern: str, path: str) -> bool:
+        # Static paths are a set lookup; a C-level prefix check rules out most other
+        # paths, and only the remainder falls back to the regex
+        if path in self.protected_paths:
+            return True
+        if not path.startswith(self.protected_prefixes):
+            return False
+        return self._match_protected_route(path)
+
+    def _match_protected_route(self, path: str) -> bool:
         """
-        Match a route pattern against a path.
-
-        Supports wildcards (*) for matching any characters.
+        Match a path against the compiled pattern for dynamic protected routes.
 
         Args:
-            pattern: The route pattern (e.g., "/api/v1/users/*")
             path: The request path
 
         Returns:
-            True if the pattern matches the path, False otherwise
+            True if the path matches a protected route pattern, False otherwise
         """
-        # Convert pattern to regex
-        # Replace * with .* for regex matching
-        regex_pattern = pattern.replace("*", ".*")
-        # Escape other special regex characters except . and *
-        regex_pattern = re.escape(regex_pattern).replace(r"\*", ".*")
-
-        # Add anchors to match the entire path
-        regex_pattern = f"^{regex_pattern}$"
-
-        return bool(re.match(regex_pattern, path))
+        return self.protected_routes.match(path) is not None
 
     def _extract_token(self, request: Request) -> Optional[str]:
         """
-        Extract JWT token from Authorization header.
+        Extract JWT token from a Bearer Authorization header.
 
         Args:
             request: The request object
@@ -170,10 +222,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
         if not authorization:
             return None
 
-        # Check if it's a Bearer token
-        if not authorization.startswith("Bearer "):
+        # Split off the auth scheme in one pass; the scheme is case-insensitive (RFC 7235)
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer":
             return None
 
-        # Extract the token part
-        token = authorization[7:]  # Remove "Bearer " prefix
-        return token if token else None  # type: ignore[no-any-return]
+        return token if token else None
@@ -1,14 +1,12 @@
-from typing import Any, Callable
-
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.utils.logger import get_logger, set_request_id
 
 logger = get_logger("context-middleware")
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware:
     """
     Middleware that propagates request context throughout the application.
 
@@ -17,8 +15,15 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
     available to all services called by the controllers.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
-        request_id = getattr(request.state, "request_id", None)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = scope.get("state", {}).get("request_id")
 
         # Make sure we have access to the request ID in this context
         if request_id:
@@ -28,20 +33,16 @@ class RequestContextMiddleware(BaseHTTPMiddleware):
 
             # Create a logger for this context
             context_logger = get_logger("context")
-            context_logger.debug(f"Setting request context: request_id={request_id}")
-
-            # Process the request with the context
-            try:
-                response = await call_next(request)
-                return response
-            except Exception as e:
-                context_logger.error(f"Error processing request: {str(e)}")
-                raise
+            context_logger.debug("Setting request context: request_id={}", request_id)
+
+            # Process the request with the context; errors are logged by the
+            # central exception handler registered in main.py
+            await self.app(scope, receive, send)
         else:
             # No request ID available (should not happen if LoggingMiddleware
             # runs first)
             logger.warning("No request_id available in request context")
-            return await call_next(request)
+            await self.app(scope, receive, send)
 
 
 def setup_context_middleware(app: FastAPI) -> None:
@@ -0,0 +1,26 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config.database import close_request_session
+
+
+class DBSessionMiddleware:
+    """
+    Middleware that scopes a single database session to each request.
+
+    The session itself is opened lazily by the get_db dependency and is
+    scoped to the asyncio task serving the request; this middleware closes
+    and discards it once the request has been handled.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            await close_request_session()
@@ -5,36 +5,116 @@ This middleware detects the user's preferred language from various sources
 and stores it in the request context for use throughout the application.
 """
 
-from contextvars import ContextVar
-from typing import Any, Callable, Optional
+from functools import lru_cache
+from http.cookies import SimpleCookie
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.utils.i18n import DEFAULT_LANGUAGE, is_language_supported
+from app.utils.i18n import DEFAULT_LANGUAGE, SUPPORTED_LANGUAGE_SET, current_language
 from app.utils.tracing import get_trace_logger
 
 logger = get_trace_logger("i18n-middleware")
 
-# Context variable to store the current language
-current_language: ContextVar[str] = ContextVar("current_language", default=DEFAULT_LANGUAGE)
+# Paths that never render translated content (API docs, static assets, metrics).
+# /health is not listed because its message is localized.
+LANGUAGE_DETECTION_SKIP_PREFIXES: Tuple[str, ...] = ("/docs", "/redoc", "/openapi.json", "/static/", "/metrics")
 
 
-def get_current_language() -> str:
-    """Get the current language from context."""
+def get_current_language(request: Optional[Request] = None) -> str:
+    """
+    Get the current language.
+
+    When a request is given, the language stored in its state by the middleware is
+    read directly; the context variable is the fallback for code without a request.
+    """
+    if request is not None:
+        language = request.scope.get("state", {}).get("language")
+        if language is not None:
+            return language  # type: ignore[no-any-return]
     return current_language.get(DEFAULT_LANGUAGE)
 
 
-def set_current_language(language: str) -> None:
-    """Set the current language in context."""
-    if is_language_supported(language):
-        current_language.set(language)
-    else:
-        logger.warning(f"Unsupported language: {language}, using default: {DEFAULT_LANGUAGE}")
-        current_language.set(DEFAULT_LANGUAGE)
+def set_current_language(language: str) -> str:
+    """Set the current language in context and return the language actually set."""
+    if language not in SUPPORTED_LANGUAGE_SET:
+        logger.warning("Unsupported language: {}, using default: {}", language, DEFAULT_LANGUAGE)
+        language = DEFAULT_LANGUAGE
+    current_language.set(language)
+    return language
+
+
+def build_language_cookie(language: str) -> str:
+    """Build the Set-Cookie header value that remembers the detected language."""
+    cookie: SimpleCookie = SimpleCookie()
+    cookie["language"] = language
+    cookie["language"]["max-age"] = 365 * 24 * 60 * 60  # 1 year
+    cookie["language"]["path"] = "/"
+    cookie["language"]["samesite"] = "lax"
+    return cookie.output(header="").strip()
 
 
-class LanguageDetectionMiddleware(BaseHTTPMiddleware):
+def get_language_cookie(scope: Scope) -> Optional[str]:
+    """Get the 'language' cookie sent with a request, if present."""
+    for name, value in scope["headers"]:
+        if name == b"cookie":
+            return parse_language_cookie(value)
+    return None
+
+
+def parse_language_cookie(cookie_header: bytes) -> Optional[str]:
+    """Get the 'language' cookie value from a raw Cookie header, if present."""
+    for chunk in cookie_header.split(b";"):
+        name, _, value = chunk.partition(b"=")
+        if name.strip() == b"language":
+            return value.strip().strip(b'"').decode("latin-1")
+    return None
+
+
+@lru_cache(maxsize=256)
+def parse_accept_language(accept_language: str) -> Optional[str]:
+    """
+    Parse Accept-Language header to find the best supported language.
+
+    Clients send the same few header values over and over, so results are cached
+    per header value; a cache hit skips parsing entirely.
+
+    Args:
+        accept_language: Accept-Language header value
+
+    Returns:
+        Best supported language code or None
+    """
+    # Single pass over the header (e.g., "jp,en;q=0.9,fr;q=0.8"), keeping the supported
+    # language with the highest quality; on ties the earliest entry wins
+    best_language: Optional[str] = None
+    best_quality = 0.0
+    for lang_part in accept_language.split(","):
+        lang, has_params, params = lang_part.partition(";")
+
+        # Extract language code (e.g., "jp-JP" -> "jp"); only supported ones are candidates
+        lang_code = lang.partition("-")[0].strip().lower()
+        if lang_code not in SUPPORTED_LANGUAGE_SET:
+            continue
+
+        quality = 1.0
+        if has_params:
+            try:
+                # Extract quality value (e.g., "q=0.9" -> 0.9)
+                quality = float(params.partition("=")[2])
+            except ValueError:
+                quality = 1.0
+
+        # q=0 marks a language as not acceptable (RFC 9110)
+        if quality > best_quality:
+            best_language, best_quality = lang_code, quality
+
+    return best_language
+
+
+class LanguageDetectionMiddleware:
     """
     Middleware to detect and set the user's preferred language.
 
@@ -43,105 +123,97 @@ class LanguageDetectionMiddleware(BaseHTTPMiddleware):
     2. Header 'Accept-Language' (e.g., Accept-Language: jp,en;q=0.9)
     3. Cookie 'language' (e.g., language=jp)
     4. Default language (en)
+
+    Requests under skip_prefixes bypass detection entirely.
     """
 
-    def __init__(self, app: Any, default_language: str = DEFAULT_LANGUAGE) -> None:
-        super().__init__(app)
+    def __init__(
+        self,
+        app: ASGIApp,
+        default_language: str = DEFAULT_LANGUAGE,
+        skip_prefixes: Tuple[str, ...] = LANGUAGE_DETECTION_SKIP_PREFIXES,
+    ) -> None:
+        self.app = app
         self.default_language = default_language
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        self.skip_prefixes = skip_prefixes
+        # Set-Cookie values only vary by language, so build them once per supported language
+        self._cookie_headers: Dict[str, bytes] = {
+            language: build_language_cookie(language).encode("latin-1")
+            for language in (*SUPPORTED_LANGUAGE_SET, default_language)
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process the request and detect language."""
-        language = self._detect_language(request)
-        set_current_language(language)
+        if scope["type"] != "http" or scope["path"].startswith(self.skip_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        language, language_cookie = self._detect_language(scope)
+        scope.setdefault("state", {})["language"] = set_current_language(language)
+
+        logger.debug("Detected language: {} for request: {}", language, scope["path"])
 
-        logger.debug(f"Detected language: {language} for request: {request.url.path}")
+        # Returning clients already hold the cookie and preflights never store it,
+        # so only emit Set-Cookie when the remembered language actually changes
+        if language == language_cookie or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
 
-        response = await call_next(request)
+        # Set language cookie for future requests (not httponly, to allow client-side access)
+        cookie_header = self._cookie_headers[language]
 
-        # Set language cookie for future requests
-        response.set_cookie(
-            key="language",
-            value=language,
-            max_age=365 * 24 * 60 * 60,  # 1 year
-            httponly=False,  # Allow client-side access
-            samesite="lax",
-        )
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (b"set-cookie", cookie_header)]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_wrapper)
 
-    def _detect_language(self, request: Request) -> str:
+    def _detect_language(self, scope: Scope) -> Tuple[str, Optional[str]]:
         """
         Detect the user's preferred language from various sources.
 
+        The query string and headers are read straight from the ASGI scope, so no
+        QueryParams, Headers or cookie dict is built for the three values needed here.
+
         Args:
-            request: FastAPI request object
+            scope: ASGI connection scope
 
         Returns:
-            Detected language code
+            Tuple of (detected language code, language cookie sent with the request)
         """
-        # 1. Check query parameter
-        lang_param = request.query_params.get("lang")
-        if lang_param and is_language_supported(lang_param):
-            logger.debug(f"Language detected from query parameter: {lang_param}")
-            return lang_param  # type: ignore[no-any-return]
+        # 1. Check query parameter (cheap bytes check before parsing the query string)
+        query_string: bytes = scope.get("query_string", b"")
+        if b"lang=" in query_string:
+            lang_values = parse_qs(query_string.decode("latin-1"), keep_blank_values=True).get("lang")
+            lang_param = lang_values[-1] if lang_values else None
+            if lang_param in SUPPORTED_LANGUAGE_SET:
+                return lang_param, get_language_cookie(scope)  # type: ignore[return-value]
+
+        accept_language: Optional[bytes] = None
+        cookie_header: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"accept-language":
+                if accept_language is None:
+                    accept_language = value
+            elif name == b"cookie":
+                if cookie_header is None:
+                    cookie_header = value
+
+        language_cookie = parse_language_cookie(cookie_header) if cookie_header else None
 
         # 2. Check Accept-Language header
-        accept_language = request.headers.get("Accept-Language", "")
         if accept_language:
-            detected_lang = self._parse_accept_language(accept_language)
+            detected_lang = parse_accept_language(accept_language.decode("latin-1"))
             if detected_lang:
-                logger.debug(f"Language detected from Accept-Language header: {detected_lang}")
-                return detected_lang
+                return detected_lang, language_cookie
 
         # 3. Check language cookie
-        language_cookie = request.cookies.get("language")
-        if language_cookie and is_language_supported(language_cookie):
-            logger.debug(f"Language detected from cookie: {language_cookie}")
-            return language_cookie  # type: ignore[no-any-return]
+        if language_cookie in SUPPORTED_LANGUAGE_SET:
+            return language_cookie, language_cookie  # type: ignore[return-value]
 
         # 4. Default language
-        logger.debug(f"Using default language: {self.default_language}")
-        return self.default_language
-
-    def _parse_accept_language(self, accept_language: str) -> Optional[str]:
-        """
-        Parse Accept-Language header to find the best supported language.
-
-        Args:
-            accept_language: Accept-Language header value
-
-        Returns:
-            Best supported language code or None
-        """
-        # Parse Accept-Language header (e.g., "jp,en;q=0.9,fr;q=0.8")
-        languages = []
-        for lang_part in accept_language.split(","):
-            lang_part = lang_part.strip()
-            if ";" in lang_part:
-                lang, q_value = lang_part.split(";", 1)
-                lang = lang.strip()
-                try:
-                    # Extract quality value (e.g., "q=0.9" -> 0.9)
-                    quality = float(q_value.split("=", 1)[1].strip())
-                except (ValueError, IndexError):
-                    quality = 1.0
-            else:
-                lang = lang_part.strip()
-                quality = 1.0
-
-            # Extract language code (e.g., "jp-JP" -> "jp")
-            lang_code = lang.split("-")[0].lower()
-            languages.append((lang_code, quality))
-
-        # Sort by quality (highest first)
-        languages.sort(key=lambda x: x[1], reverse=True)
-
-        # Find the first supported language
-        for lang_code, _ in languages:
-            if is_language_supported(lang_code):
-                return lang_code
-
-        return None
+        return self.default_language, language_cookie
 
 
 def setup_language_middleware(app: Any, default_language: str = DEFAULT_LANGUAGE) -> None:
@@ -153,4 +225,4 @@ def setup_language_middleware(app: Any, default_language: str = DEFAULT_LANGUAGE
         default_language: Default language code
     """
     app.add_middleware(LanguageDetectionMiddleware, default_language=default_language)
-    logger.info(f"Language detection middleware added with default language: {default_language}")
+    logger.info("Language detection middleware added with default language: {}", default_language)
@@ -1,47 +1,59 @@
 import time
-from typing import Any, Callable
 
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.utils.tracing import add_trace_headers_to_response, get_trace_logger, set_trace_context_from_request
+from app.utils.tracing import get_trace_logger, set_trace_context_from_scope
 
 logger = get_trace_logger("http")
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
-        # Set up request tracing context and get the request ID
-        request_id = set_trace_context_from_request(request)
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware that sets up request tracing and logs every request.
+
+    Each request is logged once, when the response start message is intercepted,
+    with its status code and timing; the X-Request-ID and X-Process-Time headers
+    are attached at the same point.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        # Get logger with request ID from context
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Set up request tracing context and get the request ID
+        request_id = set_trace_context_from_scope(scope)
 
-        # Log the request
-        logger.info(f"{request.method} {request.url.path}")
+        method = scope["method"]
+        path = scope["path"]
 
         # Process the request and track timing
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        try:
-            # Process the request
-            response = await call_next(request)
-            process_time = time.time() - start_time
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Format the elapsed time once for both the log line and the header
+                process_time = f"{time.perf_counter() - start_time:.4f}"
 
-            # Log the response
-            logger.info(
-                f"{request.method} {request.url.path} - " f"Status: {response.status_code} - Time: {process_time:.4f}s"
-            )
+                # Log the response
+                logger.info("{} {} - Status: {} - Time: {}s", method, path, message["status"], process_time)
 
-            # Add trace headers to response
-            add_trace_headers_to_response(response, request_id)
-            response.headers["X-Process-Time"] = str(process_time)
+                # Add trace headers to response as raw ASGI header pairs
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-request-id", request_id.encode("latin-1")),
+                    (b"x-process-time", process_time.encode("latin-1")),
+                ]
 
-            return response
+            await send(message)
 
-        except Exception:
-            # Don't log exceptions here - let the exception middleware handle logging
-            # This prevents duplicate logging for known expected cases (like 409 Conflict)
-            raise
+        # Don't log exceptions here - let the exception middleware handle logging
+        # This prevents duplicate logging for known expected cases (like 409 Conflict)
+        await self.app(scope, receive, send_wrapper)
 
 
 def setup_logging_middleware(app: FastAPI) -> FastAPI:
@@ -1,18 +1,43 @@
-from datetime import datetime
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
-from sqlalchemy import BigInteger, Column, DateTime, inspect
+from sqlalchemy import BigInteger, Column, DateTime, func, inspect
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.sql.expression import FunctionElement
 
 from app.config.database import Base
 
 
+class utcnow(FunctionElement):  # noqa: N801
+    """Current UTC time as a naive timestamp, whatever the database session's time zone is"""
+
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element: utcnow, compiler: Any, **kw: Any) -> str:
+    return compiler.process(func.timezone("utc", func.now()), **kw)
+
+
+@compiles(utcnow, "sqlite")
+def _compile_utcnow_sqlite(element: utcnow, compiler: Any, **kw: Any) -> str:
+    # SQLite has no time zone support; CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
 class BaseModel(Base):
     """Base model for all database models"""
 
     __abstract__ = True
 
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself (RETURNING) instead of
+    # expiring them, so they can be read without a lazy load on an async session
+    __mapper_args__ = {"eager_defaults": True}
+
     @declared_attr  # type: ignore[misc]
     def __tablename__(cls) -> str:
         """Generate __tablename__ automatically from class name"""
@@ -20,8 +45,8 @@ class BaseModel(Base):
 
     # Common columns for all models
     id = Column(BigInteger, primary_key=True, autoincrement=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utcnow(), nullable=False)
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False)
     deleted_at = Column(DateTime, nullable=True, default=None)
 
     @property
@@ -29,29 +54,36 @@ class BaseModel(Base):
         """Check if the record is active (not deleted)"""
         return self.deleted_at is None
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _column_names(cls) -> Tuple[str, ...]:
+        """Get the table column names, computed once per model class"""
+        return tuple(c.name for c in cls.__table__.columns)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model instance to dictionary"""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        return {name: getattr(self, name) for name in type(self)._column_names()}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BaseModel":
         """Create model instance from dictionary"""
-        return cls(**{k: v for k, v in data.items() if k in cls.__table__.columns.keys()})
+        return cls(**{name: data[name] for name in cls._column_names() if name in data})
 
     def __repr__(self) -> str:
         """String representation of the model"""
         return f"<{self.__class__.__name__}(id={self.id})>"
 
     @classmethod
-    def get_relationships(cls) -> Dict[str, RelationshipProperty]:
+    @lru_cache(maxsize=None)
+    def get_relationships(cls) -> Mapping[str, RelationshipProperty]:
         """
         Discover relationships using SQLAlchemy inspection.
 
+        Mappers do not change after configuration, so the result is computed once
+        per model class and returned as a read-only view.
+
         Returns:
-            Dict mapping relationship name to SQLAlchemy RelationshipProperty
+            Mapping of relationship name to SQLAlchemy RelationshipProperty
         """
         mapper = inspect(cls)
-        relationships = {}
-        for prop in mapper.relationships:
-            relationships[prop.key] = prop
-        return relationships
+        return MappingProxyType({prop.key: prop for prop in mapper.relationships})
@@ -1,10 +1,17 @@
-from typing import Optional
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
 
 from sqlalchemy import Boolean, Column, String
 from werkzeug.security import check_password_hash, generate_password_hash
 
 from app.models.base_model import BaseModel
 
+# Worker threads for CPU-bound password hashing and checks, so they never block the event loop.
+# hashlib's scrypt/pbkdf2 release the GIL, so one thread per core runs hashes in parallel.
+_password_hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash")
+
 
 class User(BaseModel):
     """User model for authentication"""
@@ -18,44 +25,46 @@ class User(BaseModel):
     is_superuser = Column(Boolean, default=False, nullable=False)
     hashed_password = Column(String, nullable=False)
 
-    def __init__(
-        self,
-        username: str = None,
-        email: str = None,
-        password: str = None,
-        full_name: Optional[str] = None,
-        is_superuser: bool = False,
-        **kwargs,
-    ) -> None:
-        """Initialize a new user"""
-        # Handle kwargs for flexibility (useful for testing and ORM)
-        if kwargs:
-            for key, value in kwargs.items():
-                # Skip relationship fields as they should be handled separately
-                if key in []:  # No relationships currently defined
-                    continue
-                if hasattr(self, key):
-                    setattr(self, key, value)
-
-        # Set required fields if provided
-        if username is not None:
-            self.username = username
-        if email is not None:
-            self.email = email
-        if password is not None:
-            self.set_password(password)
-        if full_name is not None:
-            self.full_name = full_name
-        self.is_superuser = is_superuser
+    @classmethod
+    def create(cls, *, password: str, **kwargs: Any) -> "User":
+        """Create a new user with the given plain password hashed"""
+        user = cls(**kwargs)
+        user.set_password(password)
+        return user
+
+    @staticmethod
+    def hash_password(password: str) -> str:
+        """Hash a plain password for storage"""
+        return generate_password_hash(password)  # type: ignore[no-any-return]
+
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        """Hash a plain password for storage in a worker thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_hash_executor, cls.hash_password, password)
 
     def set_password(self, password: str) -> None:
         """Set password hash"""
-        self.hashed_password = generate_password_hash(password)
+        self.hashed_password = self.hash_password(password)
+
+    async def set_password_async(self, password: str) -> None:
+        """Set password hash, hashing in a worker thread"""
+        self.hashed_password = await self.hash_password_async(password)
 
     def check_password(self, password: str) -> bool:
         """Check password against stored hash"""
         return check_password_hash(self.hashed_password, password)  # type: ignore[no-any-return]
 
+    async def check_password_async(self, password: str) -> bool:
+        """Check password against stored hash in a worker thread"""
+        return await self.verify_password_async(self.hashed_password, password)
+
+    @staticmethod
+    async def verify_password_async(hashed_password: str, password: str) -> bool:
+        """Check a password against a stored hash in a worker thread, without a User instance"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_password_hash_executor, check_password_hash, hashed_password, password)
+
     # Relationships
     # No relationships defined - User model is standalone
 
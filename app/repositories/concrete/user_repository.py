@@ -1,12 +1,23 @@
-from typing import Optional
+from typing import Any, Dict, List, Optional, Set, Union
 
-from sqlalchemy import select
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Row, bindparam, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.repositories.core import RepositoryImpl
 from app.repositories.factory import repository_factory
 
+# Lookup statements on unique columns, built once and executed with bound values
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SELECT_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_SELECT_BY_PHONE_NUMBER = select(User).where(User.phone_number == bindparam("phone_number"))
+
+# Only the columns needed to verify a login, so no User instance is built for it
+_SELECT_CREDENTIALS_BY_USERNAME = select(User.id, User.username, User.hashed_password, User.deleted_at).where(
+    User.username == bindparam("username")
+)
+
 
 class UserRepository(RepositoryImpl[User]):
     """Repository for User model extending from unified repository"""
@@ -21,21 +32,69 @@ class UserRepository(RepositoryImpl[User]):
             optimistic_lock_validator=unified_repo.optimistic_lock_validator,
         )
 
+    async def create(self, db: AsyncSession, *, obj_in: Union[Dict[str, Any], User]) -> User:
+        """Create a user, storing a plain 'password' as 'hashed_password'"""
+        return await super().create(db, obj_in=await self._hash_password_field(obj_in))
+
+    async def create_with_relations(self, db: AsyncSession, *, obj_in: Union[Dict[str, Any], User]) -> User:
+        """Create a user with nested relationships, storing a plain 'password' as 'hashed_password'"""
+        return await super().create_with_relations(db, obj_in=await self._hash_password_field(obj_in))
+
+    @staticmethod
+    async def _hash_password_field(obj_in: Union[Dict[str, Any], User]) -> Dict[str, Any]:
+        """Get the input data with a plain 'password' replaced by its hash"""
+        obj_data = obj_in if isinstance(obj_in, dict) else jsonable_encoder(obj_in)
+        if "password" in obj_data:
+            obj_data = dict(obj_data)
+            obj_data["hashed_password"] = await User.hash_password_async(obj_data.pop("password"))
+        return obj_data
+
     # User-specific methods that can't be handled by base repository
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email"""
-        result = await db.execute(select(User).filter(User.email == email))
-        return result.scalar_one_or_none()  # type: ignore[no-any-return]
+        return await db.scalar(_SELECT_BY_EMAIL, {"email": email})  # type: ignore[no-any-return]
 
     async def get_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
         """Get user by username"""
-        result = await db.execute(select(User).filter(User.username == username))
-        return result.scalar_one_or_none()  # type: ignore[no-any-return]
+        return await db.scalar(_SELECT_BY_USERNAME, {"username": username})  # type: ignore[no-any-return]
+
+    async def get_credentials_by_username(self, db: AsyncSession, username: str) -> Optional[Row]:
+        """Get the id, username, password hash and deletion time of a user by username"""
+        result = await db.execute(_SELECT_CREDENTIALS_BY_USERNAME, {"username": username})
+        return result.first()
 
     async def get_by_phone_number(self, db: AsyncSession, phone_number: str) -> Optional[User]:
         """Get user by phone number"""
-        result = await db.execute(select(User).filter(User.phone_number == phone_number))
-        return result.scalar_one_or_none()  # type: ignore[no-any-return]
+        return await db.scalar(_SELECT_BY_PHONE_NUMBER, {"phone_number": phone_number})  # type: ignore[no-any-return]
+
+    async def get_by_email_or_phone_number(
+        self, db: AsyncSession, email: Optional[str], phone_number: Optional[str]
+    ) -> List[User]:
+        """Get users matching the email or the phone number in a single query"""
+        conditions = []
+        if email:
+            conditions.append(User.email == email)
+        if phone_number:
+            conditions.append(User.phone_number == phone_number)
+        if not conditions:
+            return []
+
+        result = await db.execute(select(User).where(or_(*conditions)))
+        return list(result.scalars().all())
+
+    async def get_by_email_or_username(self, db: AsyncSession, email: Optional[str], username: str) -> List[User]:
+        """Get users matching the email or the username in a single query"""
+        conditions = [User.username == username]
+        if email:
+            conditions.append(User.email == email)
+
+        result = await db.execute(select(User).where(or_(*conditions)))
+        return list(result.scalars().all())
+
+    async def get_usernames_with_prefix(self, db: AsyncSession, prefix: str) -> Set[str]:
+        """Get all usernames starting with the given prefix"""
+        result = await db.execute(select(User.username).where(User.username.startswith(prefix, autoescape=True)))
+        return set(result.scalars().all())
 
 
 # Create instance for dependency injection
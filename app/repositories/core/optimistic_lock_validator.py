@@ -5,12 +5,30 @@ This module handles optimistic lock validation operations, separating this conce
 from the main repository logic.
 """
 
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 
 from fastapi import HTTPException, status
 
 from app.repositories.core.interfaces import OptimisticLockValidator
 from app.utils.i18n import __
+from app.utils.tracing import get_trace_logger
+
+logger = get_trace_logger("optimistic-lock-validator")
+
+# Timestamps within this distance of the stored one still count as a match
+OPTIMISTIC_LOCK_TOLERANCE = timedelta(seconds=1)
+
+if sys.version_info >= (3, 11):
+    # Accepts the "Z" suffix and other RFC 3339 forms directly
+    _parse_isoformat = datetime.fromisoformat
+else:
+
+    def _parse_isoformat(timestamp_str: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC"""
+        if timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        return datetime.fromisoformat(timestamp_str)
 
 
 class DefaultOptimisticLockValidator(OptimisticLockValidator):
@@ -30,14 +48,7 @@ class DefaultOptimisticLockValidator(OptimisticLockValidator):
             HTTPException: If timestamp format is invalid
         """
         try:
-            # Handle both with and without timezone info
-            if timestamp_str.endswith("Z"):
-                return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            elif "+" in timestamp_str or timestamp_str.count("-") > 2:
-                return datetime.fromisoformat(timestamp_str)
-            else:
-                # Assume UTC if no timezone info
-                return datetime.fromisoformat(timestamp_str)
+            return _parse_isoformat(timestamp_str)
         except ValueError:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=__("optimistic_lock.invalid_timestamp"))
 
@@ -56,11 +67,7 @@ class DefaultOptimisticLockValidator(OptimisticLockValidator):
         Raises:
             HTTPException: If optimistic lock validation fails
         """
-        from app.utils.tracing import get_trace_logger
-
-        logger = get_trace_logger("optimistic-lock-validator")
-
         expected_dt = self.parse_timestamp(expected_timestamp)
-        if abs((actual_timestamp - expected_dt).total_seconds()) > 1:  # Allow 1 second tolerance
-            logger.warning(f"Optimistic lock conflict for {model_name} {record_id}")
+        if abs(actual_timestamp - expected_dt) > OPTIMISTIC_LOCK_TOLERANCE:
+            logger.warning("Optimistic lock conflict for {} {}", model_name, record_id)
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=__("optimistic_lock.conflict"))
@@ -19,6 +19,13 @@ class DefaultQueryBuilder(QueryBuilder):
     def __init__(self, model: Type[BaseModel]):
         self.model = model
 
+        # Column attributes, base statements and sort clauses only depend on the model, so build them once
+        self._base_query_all = select(self.model)
+        self._base_query_active = self._base_query_all.where(self.model.deleted_at.is_(None))
+        self._columns = {column.key: getattr(self.model, column.key) for column in self.model.__table__.columns}
+        self._ascending = {key: attribute.asc() for key, attribute in self._columns.items()}
+        self._descending = {key: attribute.desc() for key, attribute in self._columns.items()}
+
     def build_base_query(
         self,
         filter_by: Optional[Dict[str, Any]] = None,
@@ -34,17 +41,15 @@ class DefaultQueryBuilder(QueryBuilder):
         Returns:
             Base query object
         """
-        query = select(self.model)
+        # Start from the prebuilt base, which filters out soft-deleted records unless explicitly requested
+        query = self._base_query_all if include_deleted else self._base_query_active
 
         # Apply filters if provided
         if filter_by:
             for column, value in filter_by.items():
-                if hasattr(self.model, column):
-                    query = query.filter(getattr(self.model, column) == value)
-
-        # Filter out soft-deleted records unless explicitly requested
-        if not include_deleted:
-            query = query.filter(self.model.deleted_at.is_(None))
+                attribute = self._columns.get(column)
+                if attribute is not None:
+                    query = query.where(attribute == value)
 
         return query
 
@@ -65,9 +70,9 @@ class DefaultQueryBuilder(QueryBuilder):
         for column in order_by:
             if column.startswith("-"):
                 # Descending order
-                query = query.order_by(getattr(self.model, column[1:]).desc())
+                query = query.order_by(self._descending[column[1:]])
             else:
                 # Ascending order
-                query = query.order_by(getattr(self.model, column).asc())
+                query = query.order_by(self._ascending[column])
 
         return query
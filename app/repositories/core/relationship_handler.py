@@ -5,20 +5,165 @@ This module handles relationship direction mapping and method resolution,
 separating this concern from the main repository logic.
 """
 
-from typing import Any, Dict, List, Optional, Type
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from weakref import WeakKeyDictionary
 
 from app.models.base_model import BaseModel
 from app.repositories.core.interfaces import RelationshipHandler
-from app.utils.model_utils import get_model_manager, get_related_model, get_relationship_type
+from app.utils.model_relationship_manager import ModelRelationshipManager, register_initialize_callback
+from app.utils.model_utils import get_model_manager
 from app.utils.relationship_types import RelationshipAdapter, RelationshipType
 from app.utils.tracing import get_trace_logger
 
 logger = get_trace_logger("relationship-handler")
 
 
+@dataclass(frozen=True)
+class RelationshipInfo:
+    """Resolved information about a single model relationship"""
+
+    # Declared explicitly because dataclass(slots=True) requires Python 3.10
+    __slots__ = (
+        "type",
+        "related_model",
+        "related_model_name",
+        "handler_method",
+        "manager_method",
+        "cascade_delete",
+        "cascade_soft_delete",
+    )
+
+    type: RelationshipType
+    related_model: Type[BaseModel]
+    related_model_name: str
+    handler_method: str
+    manager_method: str
+    cascade_delete: bool
+    cascade_soft_delete: bool
+
+    def __getitem__(self, key: str) -> Any:
+        """Support the dict-style access used before relationship info was a dataclass"""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+# Pre-resolved relationship information per manager and model:
+# {manager: {model_name: {relationship_name: info}}}
+_relationship_indexes: "WeakKeyDictionary[ModelRelationshipManager, Dict[str, Mapping[str, RelationshipInfo]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_relationship_index(manager: ModelRelationshipManager, model_name: str) -> Mapping[str, RelationshipInfo]:
+    """
+    Get the relationship information of a model, keyed by relationship name.
+
+    The index is built from the given manager's graph on first access and kept
+    once that graph is initialized, so every later lookup is a plain dict access.
+    """
+    model_indexes = _relationship_indexes.get(manager)
+    if model_indexes is not None:
+        index = model_indexes.get(model_name)
+        if index is not None:
+            return index
+
+    edges = {edge.relationship_name: edge for edge in manager.get_outgoing_edges(model_name)}
+    entries: Dict[str, RelationshipInfo] = {}
+    node = manager.get_model_node(model_name)
+
+    for relationship_name in node.relationships if node else ():
+        rel_type = node.get_relationship_type(relationship_name)
+        related_model = node.get_related_model(relationship_name)
+        if not rel_type or not related_model:
+            continue
+
+        edge = edges.get(relationship_name)
+        entries[sys.intern(relationship_name)] = RelationshipInfo(
+            type=rel_type,
+            related_model=related_model,
+            related_model_name=sys.intern(related_model.__name__),
+            handler_method=RelationshipAdapter.get_handler_method(rel_type),
+            manager_method=RelationshipAdapter.get_manager_method(rel_type),
+            cascade_delete=bool(edge and edge.cascade_delete),
+            cascade_soft_delete=bool(edge and edge.cascade_soft_delete),
+        )
+
+    index = MappingProxyType(entries)
+    # Lookups made before the graph is built must not freeze an incomplete index
+    if manager.is_initialized():
+        _relationship_indexes.setdefault(manager, {})[model_name] = index
+    return index
+
+
+def clear_relationship_index(manager: Optional[ModelRelationshipManager] = None) -> None:
+    """
+    Drop the cached relationship index, e.g. after models are registered again.
+
+    Args:
+        manager: Manager whose index to drop, or None to drop every index
+    """
+    if manager is None:
+        _relationship_indexes.clear()
+    else:
+        _relationship_indexes.pop(manager, None)
+
+
+# Rebuild the index from the new graph whenever the model manager is (re)initialized
+register_initialize_callback(clear_relationship_index)
+
+
+@lru_cache(maxsize=256)
+def _resolve_method(owner_type: type, method_name: str) -> Callable[..., Any]:
+    """Look up a method on a class once, returning the plain function to bind to instances."""
+    return getattr(owner_type, method_name)
+
+
+def _iter_path(path: Union[str, Sequence[str]]) -> Iterator[str]:
+    """
+    Iterate over the parts of a dot-separated relationship path.
+
+    Parts are split off one at a time, so a walk that stops at an invalid first
+    part never splits the rest of the path. Already split parts are passed through.
+    """
+    if not isinstance(path, str):
+        yield from path
+        return
+
+    rest = path
+    while True:
+        head, sep, rest = rest.partition(".")
+        yield head
+        if not sep:
+            return
+
+
 class DefaultRelationshipHandler(RelationshipHandler):
     """Handles relationship direction mapping and method resolution using the model relationship manager."""
 
+    def __init__(self, manager: Optional[ModelRelationshipManager] = None) -> None:
+        # Bind the manager once; by default it is the process-wide model relationship manager
+        self._manager = manager if manager is not None else get_model_manager()
+
     def get_relationship_handler(self, direction: Any, uselist: bool = True) -> str:
         """
         Get the appropriate handler method name for a relationship direction.
@@ -47,7 +192,40 @@ class DefaultRelationshipHandler(RelationshipHandler):
         relationship_type = RelationshipAdapter.get_application_type(direction, uselist)
         return RelationshipAdapter.get_manager_method(relationship_type)
 
-    def get_model_relationships(self, model_name: str) -> Dict[str, Any]:
+    def get_handler_callable(self, repository: Any, direction: Any, uselist: bool = True) -> Callable[..., Any]:
+        """
+        Get the handler method for a relationship direction, bound to a repository.
+
+        Resolve it once before looping over related records and call the returned
+        method directly, instead of looking the method up by name for every record.
+
+        Args:
+            repository: Repository instance providing the handler methods
+            direction: SQLAlchemy relationship direction constant
+            uselist: Whether the relationship uses a list (False for one-to-one)
+
+        Returns:
+            Bound handler method
+        """
+        method_name = self.get_relationship_handler(direction, uselist)
+        return _resolve_method(type(repository), method_name).__get__(repository)
+
+    def get_manager_callable(self, manager: Any, direction: Any, uselist: bool = True) -> Callable[..., Any]:
+        """
+        Get the manager method for a relationship direction, bound to a manager.
+
+        Args:
+            manager: Object providing the relationship manager methods
+            direction: SQLAlchemy relationship direction constant
+            uselist: Whether the relationship uses a list (False for one-to-one)
+
+        Returns:
+            Bound manager method
+        """
+        method_name = self.get_relationship_manager(direction, uselist)
+        return _resolve_method(type(manager), method_name).__get__(manager)
+
+    def get_model_relationships(self, model_name: str) -> Mapping[str, Any]:
         """
         Get all relationships for a model using the model relationship manager.
 
@@ -57,10 +235,9 @@ class DefaultRelationshipHandler(RelationshipHandler):
         Returns:
             Dictionary of relationship names to relationship properties
         """
-        manager = get_model_manager()
-        return manager.get_relationships(model_name)
+        return self._manager.get_relationships(model_name)
 
-    def get_relationship_info(self, model_name: str, relationship_name: str) -> Optional[Dict[str, Any]]:
+    def get_relationship_info(self, model_name: str, relationship_name: str) -> Optional[RelationshipInfo]:
         """
         Get detailed information about a specific relationship.
 
@@ -69,113 +246,155 @@ class DefaultRelationshipHandler(RelationshipHandler):
             relationship_name: Name of the relationship
 
         Returns:
-            Dictionary with relationship information or None if not found
+            Relationship information or None if not found
         """
-        rel_type = get_relationship_type(model_name, relationship_name)
-        related_model = get_related_model(model_name, relationship_name)
+        return _get_relationship_index(self._manager, model_name).get(relationship_name)
 
-        if not rel_type or not related_model:
-            return None
+    def get_relationship_infos(
+        self, model_name: str, relationship_names: Iterable[str]
+    ) -> List[Optional[RelationshipInfo]]:
+        """
+        Get information about several relationships of the same model.
+
+        Args:
+            model_name: Name of the model
+            relationship_names: Names of the relationships
+
+        Returns:
+            Relationship information for each name, in order, with None for unknown names
+        """
+        index = _get_relationship_index(self._manager, model_name)
+        return [index.get(relationship_name) for relationship_name in relationship_names]
+
+    def _walk_path(self, model_name: str, path: Union[str, Sequence[str]]) -> Iterator[Optional[RelationshipInfo]]:
+        """
+        Walk a relationship path lazily, resolving one step at a time.
+
+        Args:
+            model_name: Starting model name
+            path: Dot-separated relationship path, or its already split parts
+
+        Yields:
+            Relationship information for each step; a final None marks a step naming
+            an unknown relationship, after which the walk stops
+        """
+        current_model = model_name
+
+        for part in _iter_path(path):
+            rel_info = _get_relationship_index(self._manager, current_model).get(part)
+            yield rel_info
+            if rel_info is None:
+                return
 
-        return {
-            "type": rel_type,
-            "related_model": related_model,
-            "related_model_name": related_model.__name__,
-            "handler_method": RelationshipAdapter.get_handler_method(rel_type),
-            "manager_method": RelationshipAdapter.get_manager_method(rel_type),
-        }
+            current_model = rel_info.related_model_name
 
-    def validate_relationship_path(self, model_name: str, path: str) -> bool:
+    def validate_relationship_path(self, model_name: str, path: Union[str, Sequence[str]]) -> bool:
         """
         Validate a relationship path (e.g., 'posts.comments').
 
         Args:
             model_name: Starting model name
-            path: Dot-separated relationship path
+            path: Dot-separated relationship path, or its already split parts
 
         Returns:
             True if the path is valid
         """
-        path_parts = path.split(".")
-        current_model = model_name
+        return None not in self._walk_path(model_name, path)
 
-        for part in path_parts:
-            relationships = get_model_manager().get_relationships(current_model)
-            if part not in relationships:
-                return False
+    def validate_relationship_paths(self, model_name: str, paths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Validate several relationship paths starting from the same model.
 
-            rel_prop = relationships[part]
-            current_model = rel_prop.mapper.class_.__name__
+        Args:
+            model_name: Starting model name
+            paths: Dot-separated relationship paths; repeated paths are validated once
 
-        return True
+        Returns:
+            Dictionary mapping each distinct path to whether it is valid
+        """
+        return {path: None not in self._walk_path(model_name, path) for path in dict.fromkeys(paths)}
 
-    def get_relationship_chain(self, model_name: str, path: str) -> Optional[List[Dict[str, Any]]]:
+    def get_relationship_chain(
+        self, model_name: str, path: Union[str, Sequence[str]]
+    ) -> Optional[List[RelationshipInfo]]:
         """
         Get a chain of relationship information for a path.
 
         Args:
             model_name: Starting model name
-            path: Dot-separated relationship path
+            path: Dot-separated relationship path, or its already split parts
 
         Returns:
-            List of relationship information dictionaries or None if invalid
+            List of relationship information or None if invalid
         """
-        if not self.validate_relationship_path(model_name, path):
-            return None
+        chain = list(self._walk_path(model_name, path))
+        return None if chain and chain[-1] is None else chain
 
-        path_parts = path.split(".")
-        chain = []
-        current_model = model_name
+    def iter_relationship_chain(self, model_name: str, path: Union[str, Sequence[str]]) -> Iterator[RelationshipInfo]:
+        """
+        Iterate over the relationship information for a path without building a list.
 
-        for part in path_parts:
-            rel_info = self.get_relationship_info(current_model, part)
-            if not rel_info:
-                return None
+        The iteration stops at the first unknown relationship; use
+        validate_relationship_path() or get_relationship_chain() when the caller
+        needs to tell a valid path from an invalid one.
 
-            chain.append(rel_info)
-            current_model = rel_info["related_model_name"]
+        Args:
+            model_name: Starting model name
+            path: Dot-separated relationship path, or its already split parts
 
-        return chain
+        Yields:
+            Relationship information for each step
+        """
+        for rel_info in self._walk_path(model_name, path):
+            if rel_info is None:
+                return
+            yield rel_info
 
-    def get_cascade_delete_relationships(self, model_name: str) -> List[str]:
+    def resolve_terminal_model(self, model_name: str, path: Union[str, Sequence[str]]) -> Optional[Type[BaseModel]]:
         """
-        Get all relationships that have cascade delete enabled.
+        Get the model class at the end of a relationship path.
 
         Args:
-            model_name: Name of the model
+            model_name: Starting model name
+            path: Dot-separated relationship path, or its already split parts
 
         Returns:
-            List of relationship names with cascade delete
+            Model class reached by the path, or None if the path is invalid
         """
-        manager = get_model_manager()
-        cascade_relationships = []
+        model_class = self._manager.get_model_class(model_name)
 
-        for edge in manager.get_outgoing_edges(model_name):
-            if edge.cascade_delete:
-                cascade_relationships.append(edge.relationship_name)
+        for rel_info in self._walk_path(model_name, path):
+            if rel_info is None:
+                return None
+            model_class = rel_info.related_model
 
-        return cascade_relationships
+        return model_class
 
-    def get_soft_delete_cascade_relationships(self, model_name: str) -> List[str]:
+    def get_cascade_delete_relationships(self, model_name: str) -> Tuple[str, ...]:
         """
-        Get all relationships that have soft delete cascade enabled.
+        Get all relationships that have cascade delete enabled.
 
         Args:
             model_name: Name of the model
 
         Returns:
-            List of relationship names with soft delete cascade
+            Read-only tuple of relationship names with cascade delete, precomputed by the model manager
         """
-        manager = get_model_manager()
-        cascade_relationships = []
+        return self._manager.get_cascade_delete_relationships(model_name)
 
-        for edge in manager.get_outgoing_edges(model_name):
-            if edge.cascade_soft_delete:
-                cascade_relationships.append(edge.relationship_name)
+    def get_soft_delete_cascade_relationships(self, model_name: str) -> Tuple[str, ...]:
+        """
+        Get all relationships that have soft delete cascade enabled.
+
+        Args:
+            model_name: Name of the model
 
-        return cascade_relationships
+        Returns:
+            Read-only tuple of relationship names with soft delete cascade, precomputed by the model manager
+        """
+        return self._manager.get_soft_delete_cascade_relationships(model_name)
 
-    def get_dependent_models(self, model_name: str) -> List[str]:
+    def get_dependent_models(self, model_name: str) -> FrozenSet[str]:
         """
         Get all models that depend on the given model.
 
@@ -183,12 +402,11 @@ class DefaultRelationshipHandler(RelationshipHandler):
             model_name: Name of the model
 
         Returns:
-            List of dependent model names
+            Read-only set of dependent model names
         """
-        manager = get_model_manager()
-        return list(manager.get_model_dependents(model_name))
+        return self._manager.get_model_dependents(model_name)
 
-    def get_dependency_models(self, model_name: str) -> List[str]:
+    def get_dependency_models(self, model_name: str) -> FrozenSet[str]:
         """
         Get all models that the given model depends on.
 
@@ -196,10 +414,9 @@ class DefaultRelationshipHandler(RelationshipHandler):
             model_name: Name of the model
 
         Returns:
-            List of dependency model names
+            Read-only set of dependency model names
         """
-        manager = get_model_manager()
-        return list(manager.get_model_dependencies(model_name))
+        return self._manager.get_model_dependencies(model_name)
 
     def is_relationship_field(self, model_name: str, field_name: str) -> bool:
         """
@@ -212,8 +429,7 @@ class DefaultRelationshipHandler(RelationshipHandler):
         Returns:
             True if the field is a relationship field
         """
-        relationships = self.get_model_relationships(model_name)
-        return field_name in relationships
+        return field_name in _get_relationship_index(self._manager, model_name)
 
     def get_relationship_type_for_field(self, model_name: str, field_name: str) -> Optional[RelationshipType]:
         """
@@ -226,10 +442,8 @@ class DefaultRelationshipHandler(RelationshipHandler):
         Returns:
             RelationshipType or None if not a relationship field
         """
-        if not self.is_relationship_field(model_name, field_name):
-            return None
-
-        return get_relationship_type(model_name, field_name)
+        rel_info = _get_relationship_index(self._manager, model_name).get(field_name)
+        return rel_info.type if rel_info else None
 
     def get_related_model_for_field(self, model_name: str, field_name: str) -> Optional[Type[BaseModel]]:
         """
@@ -242,7 +456,5 @@ class DefaultRelationshipHandler(RelationshipHandler):
         Returns:
             Related model class or None if not a relationship field
         """
-        if not self.is_relationship_field(model_name, field_name):
-            return None
-
-        return get_related_model(model_name, field_name)
+        rel_info = _get_relationship_index(self._manager, model_name).get(field_name)
+        return rel_info.related_model if rel_info else None
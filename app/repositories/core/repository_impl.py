@@ -94,7 +94,8 @@ class RepositoryImpl(Repository[ModelType], Generic[ModelType]):
             db: Database session
             id: Record ID
             include_deleted: Whether to include soft-deleted records
-            relations: List of relationship names to load (None = load all)
+            relations: List of relationship names to load, dotted for nested ones
+                (e.g. "comments.author"); None = load all direct relationships
 
         Returns:
             Model instance with relationships loaded or None if not found
@@ -108,27 +109,7 @@ class RepositoryImpl(Repository[ModelType], Generic[ModelType]):
             query = query.filter(self.model.deleted_at.is_(None))
 
         # Load relationships if specified
-        relationship_options = []
-        if relations:
-            # Load specific relationships
-            for rel_name in relations:
-                try:
-                    if rel_name in self.model_relationship_manager.get_relationships(self.model_name):
-                        relationship_options.append(selectinload(getattr(self.model, rel_name)))
-                        logger.debug(f"Loading relationship: {rel_name}")
-                    else:
-                        logger.warning(f"Unknown relationship: {self.model_name}.{rel_name}")
-                except (AttributeError, TypeError) as e:
-                    logger.warning(f"Error loading relationship {self.model_name}.{rel_name}: {e}")
-        else:
-            # Load all relationships
-            all_relations = self.model_relationship_manager.get_relationships(self.model_name)
-            for rel_name in all_relations.keys():
-                try:
-                    relationship_options.append(selectinload(getattr(self.model, rel_name)))
-                    logger.debug(f"Loading relationship: {rel_name}")
-                except (AttributeError, TypeError) as e:
-                    logger.warning(f"Error loading relationship {self.model_name}.{rel_name}: {e}")
+        relationship_options = self._build_relationship_options(relations)
 
         # Apply all relationship options at once
         if relationship_options:
@@ -196,7 +177,8 @@ class RepositoryImpl(Repository[ModelType], Generic[ModelType]):
             filter_by: Optional filtering criteria
             order_by: Optional sorting criteria
             include_deleted: Whether to include soft-deleted records
-            relations: List of relationship names to load (None = load all)
+            relations: List of relationship names to load, dotted for nested ones
+                (e.g. "comments.author"); None = load all direct relationships
 
         Returns:
             List of model instances with relationships loaded
@@ -208,27 +190,7 @@ class RepositoryImpl(Repository[ModelType], Generic[ModelType]):
         query = query.offset(skip).limit(limit)
 
         # Load relationships if specified
-        relationship_options = []
-        if relations:
-            # Load specific relationships
-            for rel_name in relations:
-                try:
-                    if rel_name in self.model_relationship_manager.get_relationships(self.model_name):
-                        relationship_options.append(selectinload(getattr(self.model, rel_name)))
-                        logger.debug(f"Loading relationship: {rel_name}")
-                    else:
-                        logger.warning(f"Unknown relationship: {self.model_name}.{rel_name}")
-                except (AttributeError, TypeError) as e:
-                    logger.warning(f"Error loading relationship {self.model_name}.{rel_name}: {e}")
-        else:
-            # Load all relationships
-            all_relations = self.model_relationship_manager.get_relationships(self.model_name)
-            for rel_name in all_relations.keys():
-                try:
-                    relationship_options.append(selectinload(getattr(self.model, rel_name)))
-                    logger.debug(f"Loading relationship: {rel_name}")
-                except (AttributeError, TypeError) as e:
-                    logger.warning(f"Error loading relationship {self.model_name}.{rel_name}: {e}")
+        relationship_options = self._build_relationship_options(relations)
 
         # Apply all relationship options at once
         if relationship_options:
@@ -240,6 +202,47 @@ class RepositoryImpl(Repository[ModelType], Generic[ModelType]):
         logger.debug(f"Found {len(records)} {self.model_name} records with loaded relationships")
         return records
 
+    def _build_relationship_options(self, relations: Optional[List[str]]) -> List[Any]:
+        """
+        Build selectinload options for eager loading relationships.
+
+        Each relationship level is fetched with one extra IN query for all parent rows,
+        so accessing it afterwards does not issue a query per row (N+1). Dotted names
+        such as "comments.author" chain the loaders to cover nested relationships.
+
+        Args:
+            relations: List of relationship names to load (None = load all direct relationships)
+
+        Returns:
+            List of loader options for query.options()
+        """
+        if not relations:
+            relations = list(self.model_relationship_manager.get_relationships(self.model_name).keys())
+
+        relationship_options = []
+        for rel_path in relations:
+            model: Any = self.model
+            loader: Any = None
+            try:
+                for rel_name in rel_path.split("."):
+                    relationship = self.model_relationship_manager.get_relationships(model.__name__).get(rel_name)
+                    if relationship is None:
+                        logger.warning(f"Unknown relationship: {model.__name__}.{rel_name}")
+                        loader = None
+                        break
+                    attribute = getattr(model, rel_name)
+                    loader = selectinload(attribute) if loader is None else loader.selectinload(attribute)
+                    model = relationship.mapper.class_
+            except (AttributeError, TypeError) as e:
+                logger.warning(f"Error loading relationship {self.model_name}.{rel_path}: {e}")
+                loader = None
+
+            if loader is not None:
+                relationship_options.append(loader)
+                logger.debug(f"Loading relationship: {rel_path}")
+
+        return relationship_options
+
     async def count(
         self, db: AsyncSession, filter_by: Optional[Dict[str, Any]] = None, include_deleted: bool = False
     ) -> int:
@@ -5,6 +5,7 @@ This module contains schemas for API requests and responses
 for user-related operations.
 """
 
+import hmac
 from datetime import datetime
 from typing import Any, Optional
 
@@ -36,7 +37,8 @@ class UserCreateRequest(BaseSchema):
     @field_validator("password_confirm")  # type: ignore[misc]
     @classmethod
     def passwords_match(cls, v: str, info: Any) -> str:
-        if "password" in info.data and v != info.data["password"]:
+        # Constant-time comparison so the check does not leak how much of the password matched
+        if "password" in info.data and not hmac.compare_digest(v.encode(), info.data["password"].encode()):
             raise ValueError("Passwords do not match")
         return v
 
@@ -43,7 +43,7 @@ class BaseService(Generic[ModelType, RepositoryType]):
         Returns:
             Record object or None if not found
         """
-        logger.debug(f"Getting {self.model_name} with id: {id}")
+        logger.debug("Getting {} with id: {}", self.model_name, id)
         return await self.repository.get_by_id_with_relations(db, id=id)
 
     async def get_all(
@@ -67,7 +67,7 @@ class BaseService(Generic[ModelType, RepositoryType]):
               Returns:
             List of record objects
         """
-        logger.debug(f"Getting list of {self.model_name}")
+        logger.debug("Getting list of {}", self.model_name)
         return await self.repository.get_all_with_relations(
             db, skip=skip, limit=limit, filter_by=filter_by, order_by=order_by
         )
@@ -101,11 +101,11 @@ class BaseService(Generic[ModelType, RepositoryType]):
         Returns:
             Created record object
         """
-        logger.info(f"Creating new {self.model_name}")
+        logger.info("Creating new {}", self.model_name)
 
         # Convert to dict if needed
         if not isinstance(obj_in, dict):
-            obj_in = obj_in.dict() if hasattr(obj_in, "dict") else obj_in
+            obj_in = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in
 
         # Always use create_with_relations to handle both simple and nested
         # data
@@ -137,18 +137,18 @@ class BaseService(Generic[ModelType, RepositoryType]):
 
         db_obj = await self.repository.get_by_id(db, id=id)
         if db_obj:
-            logger.info(f"Updating {self.model_name} with id: {id}")
+            logger.info("Updating {} with id: {}", self.model_name, id)
 
             # Convert to dict if needed
             if not isinstance(obj_in, dict):
-                obj_in = obj_in.dict() if hasattr(obj_in, "dict") else obj_in
+                obj_in = obj_in.model_dump() if hasattr(obj_in, "model_dump") else obj_in
 
             # Always use update_with_optimistic_lock_and_relations to handle both
             # simple and nested data
             return await self.repository.update_with_optimistic_lock_and_relations(
                 db, id=id, obj_in=obj_in, sync_mode="merge"
             )
-        logger.warning(f"{self.model_name} with id {id} not found for update")
+        logger.warning("{} with id {} not found for update", self.model_name, id)
         return None
 
     async def delete(self, db: AsyncSession, *, id: str, hard_delete: bool = False) -> Optional[ModelType]:
@@ -169,7 +169,7 @@ class BaseService(Generic[ModelType, RepositoryType]):
             Deleted record object or None if not found
         """
 
-        logger.info(f"Deleting {self.model_name} with id: {id} (hard_delete: {hard_delete})")
+        logger.info("Deleting {} with id: {} (hard_delete: {})", self.model_name, id, hard_delete)
 
         # Always use delete_with_cascade to handle both simple and cascade
         # deletion
@@ -197,7 +197,7 @@ class BaseService(Generic[ModelType, RepositoryType]):
         Returns:
             Parent record or None if not found
         """
-        logger.info(f"Managing {operation} operation for {relation_name} on {self.model_name} {parent_id}")
+        logger.info("Managing {} operation for {} on {} {}", operation, relation_name, self.model_name, parent_id)
 
         # Delegate to repository layer for database operations
         result = await self.repository.manage_relations(
@@ -209,8 +209,8 @@ class BaseService(Generic[ModelType, RepositoryType]):
         )
 
         if result:
-            logger.info(f"Successfully completed {operation} operation for {relation_name}")
+            logger.info("Successfully completed {} operation for {}", operation, relation_name)
         else:
-            logger.warning(f"Failed to complete {operation} operation for {relation_name}")
+            logger.warning("Failed to complete {} operation for {}", operation, relation_name)
 
         return result
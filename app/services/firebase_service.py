@@ -1,7 +1,11 @@
 """Firebase Admin SDK service for token verification"""
 
+import asyncio
+import hashlib
 import json
-from typing import Dict, Optional
+import time
+from functools import partial
+from typing import Dict, Optional, Tuple
 
 import firebase_admin
 from firebase_admin import auth, credentials
@@ -12,12 +16,20 @@ from app.utils.logger import get_logger
 
 logger = get_logger("firebase-service")
 
+# Verified token claims are reused for at most this many seconds (and never past the token's exp)
+VERIFIED_TOKEN_CACHE_TTL_SECONDS = 300
+VERIFIED_TOKEN_CACHE_SIZE = 50000
+
 
 class FirebaseService:
     """Service for Firebase Admin SDK operations"""
 
     def __init__(self) -> None:
         self._initialized = False
+        # Token digest -> (expiry timestamp, verified user data)
+        self._verified_tokens: Dict[str, Tuple[float, Dict[str, any]]] = {}
+        # Token digest -> verification currently running for that token
+        self._inflight_verifications: Dict[str, "asyncio.Future[Dict[str, any]]"] = {}
         self._initialize_firebase()
 
     def _initialize_firebase(self) -> None:
@@ -35,7 +47,7 @@ class FirebaseService:
                             self._initialized = True
                         except FileNotFoundError:
                             logger.warning(
-                                f"Firebase service account file not found: {settings.FIREBASE_SERVICE_ACCOUNT_PATH}"
+                                "Firebase service account file not found: {}", settings.FIREBASE_SERVICE_ACCOUNT_PATH
                             )
                     # Try to load from JSON string in environment variable
                     elif settings.FIREBASE_SERVICE_ACCOUNT_JSON:
@@ -54,13 +66,17 @@ class FirebaseService:
                 if self._initialized:
                     logger.info("Firebase service initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize Firebase Admin SDK: {str(e)}")
+            logger.error("Failed to initialize Firebase Admin SDK: {}", e)
             # Don't raise - allow app to start without Firebase
 
     async def verify_firebase_token(self, id_token: str) -> Dict[str, any]:
         """
         Verify Firebase ID token and return decoded token data
 
+        Successful verifications are cached by a digest of the token until the token
+        expires or VERIFIED_TOKEN_CACHE_TTL_SECONDS pass, whichever comes first.
+        Concurrent requests for the same token share a single verification.
+
         Args:
             id_token: Firebase ID token from client
 
@@ -77,13 +93,61 @@ class FirebaseService:
                 detail="Firebase service not configured",
             )
 
+        # Key the cache by a digest so raw tokens are never kept in memory
+        token_digest = hashlib.blake2b(id_token.encode(), digest_size=16).hexdigest()
+        cached = self._verified_tokens.get(token_digest)
+        if cached is not None:
+            if cached[0] > time.time():
+                return dict(cached[1])
+            del self._verified_tokens[token_digest]
+
+        # Coalesce concurrent verifications of the same token (e.g. client retries). The
+        # verification runs as its own task and every caller, including the one that
+        # started it, awaits it through a shield, so one caller's cancellation (e.g. a
+        # client disconnect) never fails the others.
+        inflight = self._inflight_verifications.get(token_digest)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._verify_token(id_token, token_digest))
+            self._inflight_verifications[token_digest] = inflight
+            inflight.add_done_callback(partial(self._finish_verification, token_digest))
+
+        return dict(await asyncio.shield(inflight))
+
+    def _finish_verification(self, token_digest: str, task: "asyncio.Future[Dict[str, any]]") -> None:
+        """
+        Forget a finished in-flight verification
+
+        Args:
+            token_digest: Digest of the verified token
+            task: The finished verification task
+        """
+        if self._inflight_verifications.get(token_digest) is task:
+            del self._inflight_verifications[token_digest]
+        # Mark the exception as retrieved in case every waiting request was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _verify_token(self, id_token: str, token_digest: str) -> Dict[str, any]:
+        """
+        Verify a Firebase ID token with the Admin SDK and cache the result
+
+        Args:
+            id_token: Firebase ID token from client
+            token_digest: Digest of the token used as cache key
+
+        Returns:
+            Dict containing user information from Firebase token
+
+        Raises:
+            HTTPException: If token is invalid or verification fails
+        """
         try:
-            # Verify the token
-            decoded_token = auth.verify_id_token(id_token)
+            # Verify the token in a worker thread; fetching Google's public keys is blocking I/O
+            decoded_token = await asyncio.to_thread(auth.verify_id_token, id_token)
 
-            logger.info(f"Firebase token verified successfully for user: {decoded_token.get('uid')}")
+            logger.info("Firebase token verified successfully for user: {}", decoded_token.get("uid"))
 
-            return {
+            firebase_user = {
                 "uid": decoded_token.get("uid"),
                 "email": decoded_token.get("email"),
                 "email_verified": decoded_token.get("email_verified", False),
@@ -92,6 +156,9 @@ class FirebaseService:
                 "phone_number": decoded_token.get("phone_number"),
                 "provider_id": decoded_token.get("firebase", {}).get("sign_in_provider"),
             }
+            self._cache_verified_token(token_digest, decoded_token.get("exp"), firebase_user)
+
+            return firebase_user
 
         except auth.InvalidIdTokenError:
             logger.warning("Invalid Firebase ID token")
@@ -118,12 +185,30 @@ class FirebaseService:
                 detail="Error verifying Firebase token",
             )
         except Exception as e:
-            logger.error(f"Unexpected error verifying Firebase token: {str(e)}")
+            logger.error("Unexpected error verifying Firebase token: {}", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Error verifying Firebase token",
             )
 
+    def _cache_verified_token(self, token_digest: str, exp: Optional[float], firebase_user: Dict[str, any]) -> None:
+        """
+        Cache verified user data for a token
+
+        Args:
+            token_digest: Digest of the verified ID token
+            exp: Token expiry as a Unix timestamp
+            firebase_user: User information extracted from the token
+        """
+        expires_at = time.time() + VERIFIED_TOKEN_CACHE_TTL_SECONDS
+        if exp is not None:
+            expires_at = min(expires_at, float(exp))
+
+        if token_digest not in self._verified_tokens and len(self._verified_tokens) >= VERIFIED_TOKEN_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._verified_tokens[next(iter(self._verified_tokens))]
+        self._verified_tokens[token_digest] = (expires_at, firebase_user)
+
     async def get_user_by_uid(self, uid: str) -> Optional[Dict[str, any]]:
         """
         Get Firebase user by UID
@@ -146,10 +231,10 @@ class FirebaseService:
                 "disabled": user_record.disabled,
             }
         except auth.UserNotFoundError:
-            logger.warning(f"Firebase user not found: {uid}")
+            logger.warning("Firebase user not found: {}", uid)
             return None
         except Exception as e:
-            logger.error(f"Error fetching Firebase user: {str(e)}")
+            logger.error("Error fetching Firebase user: {}", e)
             return None
 
 
@@ -1,5 +1,6 @@
 from typing import Optional, Tuple
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import ConflictException
@@ -22,17 +23,17 @@ class UserService(BaseService[User, UserRepository]):
 
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """Get user by email"""
-        logger.debug(f"Looking up user by email: {email}")
+        logger.debug("Looking up user by email: {}", email)
         return await user_repository.get_by_email(db, email=email)
 
     async def get_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
         """Get user by username"""
-        logger.debug(f"Looking up user by username: {username}")
+        logger.debug("Looking up user by username: {}", username)
         return await user_repository.get_by_username(db, username=username)
 
     async def get_by_phone_number(self, db: AsyncSession, phone_number: str) -> Optional[User]:
         """Get user by phone number"""
-        logger.debug(f"Looking up user by phone number: {phone_number}")
+        logger.debug("Looking up user by phone number: {}", phone_number)
         return await user_repository.get_by_phone_number(db, phone_number=phone_number)
 
     async def create_user(
@@ -41,35 +42,45 @@ class UserService(BaseService[User, UserRepository]):
         user_data: UserCreate,
     ) -> User:
         """Create a new user"""
-        logger.info(f"Creating new user with username: {user_data.username}, email: {user_data.email}")
+        logger.info("Creating new user with username: {}, email: {}", user_data.username, user_data.email)
+
+        # Look up email and username conflicts in one query
+        existing_users = await user_repository.get_by_email_or_username(
+            db, email=user_data.email, username=user_data.username
+        )
 
         # Check if email already exists
-        if await self.get_by_email(db, email=user_data.email):
-            logger.warning(f"Attempt to create user with existing email: {user_data.email}")
+        if user_data.email and any(existing.email == user_data.email for existing in existing_users):
+            logger.warning("Attempt to create user with existing email: {}", user_data.email)
             raise ConflictException(__("user.email_already_exists"))
 
         # Check if username already exists
-        if await self.get_by_username(db, username=user_data.username):
-            logger.warning(f"Attempt to create user with existing username: {user_data.username}")
+        if any(existing.username == user_data.username for existing in existing_users):
+            logger.warning("Attempt to create user with existing username: {}", user_data.username)
             raise ConflictException(__("user.username_already_exists"))
 
         # Create user using the schema
         return await user_repository.create(db, obj_in=user_data)
 
-    async def authenticate_user(self, db: AsyncSession, username: str, password: str) -> Optional[User]:
-        """Authenticate a user by username and password"""
-        logger.debug(f"Authenticating user: {username}")
-        user = await self.get_by_username(db, username=username)
+    async def authenticate_user(self, db: AsyncSession, username: str, password: str) -> Optional[Row]:
+        """
+        Authenticate a user by username and password.
 
-        if not user:
-            logger.warning(f"Authentication failed: user not found: {username}")
+        Only the credential columns are loaded; the returned row carries the user's
+        id, username, hashed_password and deleted_at.
+        """
+        logger.debug("Authenticating user: {}", username)
+        credentials = await user_repository.get_credentials_by_username(db, username=username)
+
+        if not credentials:
+            logger.warning("Authentication failed: user not found: {}", username)
             return None
 
-        if not user.check_password(password):
-            logger.warning(f"Authentication failed: incorrect password for user: {username}")
+        if not await User.verify_password_async(credentials.hashed_password, password):
+            logger.warning("Authentication failed: incorrect password for user: {}", username)
             return None
 
-        return user
+        return credentials
 
     async def update_user_with_optimistic_lock(
         self,
@@ -79,7 +90,7 @@ class UserService(BaseService[User, UserRepository]):
         expected_updated_at: Optional[str] = None,
     ) -> User:
         """Update user with optimistic locking"""
-        logger.debug(f"Updating user {user_id} with optimistic lock")
+        logger.debug("Updating user {} with optimistic lock", user_id)
         return await user_repository.update_with_optimistic_lock(
             db=db,
             id=user_id,
@@ -110,23 +121,23 @@ class UserService(BaseService[User, UserRepository]):
         Returns:
             Tuple of (User, is_new_user)
         """
-        # Try to find existing user by email or phone
-        user = None
-        
+        # Try to find existing user by email or phone (one query; an email match wins)
+        matches = await user_repository.get_by_email_or_phone_number(db, email=email, phone_number=phone_number)
+
         if email:
-            user = await self.get_by_email(db, email=email)
+            user = next((match for match in matches if match.email == email), None)
             if user:
-                logger.info(f"Existing user found by email for Firebase UID {firebase_uid}: {email}")
+                logger.info("Existing user found by email for Firebase UID {}: {}", firebase_uid, email)
                 return user, False
-        
+
         if phone_number:
-            user = await self.get_by_phone_number(db, phone_number=phone_number)
+            user = next((match for match in matches if match.phone_number == phone_number), None)
             if user:
-                logger.info(f"Existing user found by phone for Firebase UID {firebase_uid}: {phone_number}")
+                logger.info("Existing user found by phone for Firebase UID {}: {}", firebase_uid, phone_number)
                 return user, False
 
         # Create new user
-        logger.info(f"Creating new user from Firebase authentication: {email or phone_number}")
+        logger.info("Creating new user from Firebase authentication: {}", email or phone_number)
 
         # Generate username from email or phone
         if email:
@@ -140,8 +151,9 @@ class UserService(BaseService[User, UserRepository]):
 
         # Check if username exists, if so append a number
         base_username = username
+        taken_usernames = await user_repository.get_usernames_with_prefix(db, prefix=base_username)
         counter = 1
-        while await self.get_by_username(db, username=username):
+        while username in taken_usernames:
             username = f"{base_username}{counter}"
             counter += 1
 
@@ -156,7 +168,7 @@ class UserService(BaseService[User, UserRepository]):
         )
 
         user = await user_repository.create(db, obj_in=user_data)
-        logger.info(f"New user created from Firebase: {email or phone_number}")
+        logger.info("New user created from Firebase: {}", email or phone_number)
 
         return user, True
 
@@ -1,5 +1,6 @@
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 from fastapi import Depends
@@ -18,11 +19,25 @@ from app.utils.tracing import get_trace_logger
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 logger = get_trace_logger("auth")
 
+# JWT settings used on every token encode/decode
+_JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [_JWT_ALGORITHM]
+
+# Signed access tokens reused for repeat logins within their lifetime:
+# (sub, lifetime in seconds) -> (monotonic reuse deadline, token)
+ACCESS_TOKEN_CACHE_SIZE = 10000
+ACCESS_TOKEN_REUSE_BUFFER_SECONDS = 60
+_access_token_cache: Dict[Tuple[str, float], Tuple[float, str]] = {}
+
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT token
 
+    Tokens whose only claim is "sub" are cached per subject and lifetime, and the
+    same token is returned again until less than a minute of its lifetime remains.
+
     Args:
         data: Data to encode in the token
         expires_delta: Token expiration time delta
@@ -30,17 +45,30 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     Returns:
         JWT token as string
     """
-    to_encode = data.copy()
+    lifetime = expires_delta or timedelta(minutes=15)
+    lifetime_seconds = lifetime.total_seconds()
 
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+    # Tokens carrying only a subject are reused until shortly before they expire
+    cache_key = (str(data["sub"]), lifetime_seconds) if data.keys() == {"sub"} else None
+    if cache_key is not None:
+        cached = _access_token_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+    to_encode = data.copy()
+    to_encode.update({"exp": datetime.utcnow() + lifetime})
+    encoded_jwt = str(jwt.encode(to_encode, _JWT_SECRET_KEY, algorithm=_JWT_ALGORITHM))
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    if cache_key is not None and lifetime_seconds > ACCESS_TOKEN_REUSE_BUFFER_SECONDS:
+        if cache_key not in _access_token_cache and len(_access_token_cache) >= ACCESS_TOKEN_CACHE_SIZE:
+            # Evict the oldest entry
+            del _access_token_cache[next(iter(_access_token_cache))]
+        _access_token_cache[cache_key] = (
+            time.monotonic() + lifetime_seconds - ACCESS_TOKEN_REUSE_BUFFER_SECONDS,
+            encoded_jwt,
+        )
 
-    return str(encoded_jwt)
+    return encoded_jwt
 
 
 def decode_token(token: str) -> Dict[str, Any]:
@@ -54,67 +82,79 @@ def decode_token(token: str) -> Dict[str, Any]:
         Decoded token payload
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _JWT_SECRET_KEY, algorithms=_JWT_ALGORITHMS)
         return payload  # type: ignore[no-any-return]
     except jwt.ExpiredSignatureError as e:
-        logger.debug(f"Token expired: {str(e)}")
+        logger.debug("Token expired: {}", e)
         raise TokenExpiredException(__("auth.token_expired"))
     except jwt.exceptions.InvalidTokenError as e:
-        logger.error(f"Error decoding token: {str(e)}")
+        logger.error("Error decoding token: {}", e)
         raise TokenInvalidException(__("auth.token_invalid"))
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> User:
+async def get_current_username(token: str = Depends(oauth2_scheme)) -> str:
     """
-    Verify token and return current user.
+    Verify token and return the username it was issued for.
 
     This function first checks if user data is available in the request context
-    (set by AuthMiddleware). If available, it uses that data to fetch the user
-    from the database. Otherwise, it falls back to decoding the token directly.
+    (set by AuthMiddleware). Otherwise, it falls back to decoding the token directly.
+    Endpoints that only need the caller's identity should depend on this instead of
+    get_current_user, which additionally loads the user from the database.
 
     Args:
         token: JWT token (used as fallback if no context data)
-        db: Database session
 
     Returns:
-        Current user data
+        Username from the token's 'sub' claim
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid
     """
-    # Fallback mapping for invalid auth scenario
-    credentials_exception = TokenInvalidException(__("auth.token_invalid"))
+    # First, try to get user data from request context (set by AuthMiddleware)
+    user_data = get_current_user_data()
 
-    try:
-        # First, try to get user data from request context (set by AuthMiddleware)
-        user_data = get_current_user_data()
+    if user_data:
+        # Use data from context (already validated by middleware)
+        username: Optional[str] = user_data.get("sub")
+        logger.debug("Using user data from request context")
+    else:
+        # Fallback: decode token directly (for backward compatibility)
+        payload = decode_token(token)
+        username = payload.get("sub")
+        logger.debug("Decoding token directly (no context data available)")
+
+    if username is None:
+        logger.warning("Token missing 'sub' claim")
+        raise TokenInvalidException(__("auth.token_invalid"))
+
+    return username
 
-        if user_data:
-            # Use data from context (already validated by middleware)
-            username: Optional[str] = user_data.get("sub")
-            logger.debug("Using user data from request context")
-        else:
-            # Fallback: decode token directly (for backward compatibility)
-            payload = decode_token(token)
-            username = payload.get("sub")
-            logger.debug("Decoding token directly (no context data available)")
 
-        if username is None:
-            logger.warning("Token missing 'sub' claim")
-            raise credentials_exception
+async def get_current_user(username: str = Depends(get_current_username), db: AsyncSession = Depends(get_db)) -> User:
+    """
+    Verify token and return current user.
+
+    The username comes from get_current_username, which prefers the user data
+    stored in the request context by AuthMiddleware; the user is then fetched
+    from the database.
+
+    Args:
+        username: Username from the verified token
+        db: Database session
 
-        # Fetch user from database
-        user = await user_service.get_by_username(db, username=username)
+    Returns:
+        Current user data
 
-        if user is None:
-            logger.warning(f"User from token not found: {username}")
-            raise credentials_exception
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user = await user_service.get_by_username(db, username=username)
 
-        return user
+    if user is None:
+        logger.warning("User from token not found: {}", username)
+        raise TokenInvalidException(__("auth.token_invalid"))
 
-    except (TokenExpiredException, TokenInvalidException):
-        # Re-raise known auth exceptions for middleware handling
-        raise
+    return user
 
 
 async def get_current_active_user(
@@ -130,7 +170,7 @@ async def get_current_active_user(
         Current active user object
     """
     if not current_user.is_active:
-        logger.warning(f"Inactive user attempt: {current_user.username}")
+        logger.warning("Inactive user attempt: {}", current_user.username)
         raise InactiveUserException(__("auth.login_inactive_user"))
 
     return current_user
@@ -6,8 +6,10 @@ from JSON files based on the user's language preference.
 """
 
 import json
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
 
 from app.utils.tracing import get_trace_logger
 
@@ -17,9 +19,19 @@ logger = get_trace_logger("i18n")
 SUPPORTED_LANGUAGES = ["en", "jp"]
 DEFAULT_LANGUAGE = "en"
 
+# Hashed view of SUPPORTED_LANGUAGES for per-request membership checks
+SUPPORTED_LANGUAGE_SET: FrozenSet[str] = frozenset(SUPPORTED_LANGUAGES)
+
+# Context variable holding the current request language; it lives here rather than
+# in the language middleware so __() can read it without a per-call import
+current_language: ContextVar[str] = ContextVar("current_language", default=DEFAULT_LANGUAGE)
+
 # Cache for loaded translations
 _translation_cache: Dict[str, Dict[str, Any]] = {}
 
+# Callbacks clearing caches derived from translated messages outside this module
+_cache_clear_callbacks: List[Callable[[], None]] = []
+
 
 def get_locales_path() -> Path:
     """Get the path to the locales directory."""
@@ -36,8 +48,8 @@ def load_translations(language: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing all translations for the language
     """
-    if language not in SUPPORTED_LANGUAGES:
-        logger.warning(f"Unsupported language: {language}, falling back to {DEFAULT_LANGUAGE}")
+    if language not in SUPPORTED_LANGUAGE_SET:
+        logger.warning("Unsupported language: {}, falling back to {}", language, DEFAULT_LANGUAGE)
         language = DEFAULT_LANGUAGE
 
     # Check cache first
@@ -48,7 +60,7 @@ def load_translations(language: str) -> Dict[str, Any]:
     messages_file = locales_path / language / "LC_MESSAGES" / "messages.json"
 
     if not messages_file.exists():
-        logger.error(f"Translation file not found: {messages_file}")
+        logger.error("Translation file not found: {}", messages_file)
         # Fallback to default language
         if language != DEFAULT_LANGUAGE:
             return load_translations(DEFAULT_LANGUAGE)
@@ -58,10 +70,10 @@ def load_translations(language: str) -> Dict[str, Any]:
         with open(messages_file, "r", encoding="utf-8") as f:
             translations = json.load(f)
             _translation_cache[language] = translations
-            logger.debug(f"Loaded translations for language: {language}")
+            logger.debug("Loaded translations for language: {}", language)
             return translations  # type: ignore[no-any-return]
     except (json.JSONDecodeError, IOError) as e:
-        logger.error(f"Error loading translations for {language}: {str(e)}")
+        logger.error("Error loading translations for {}: {}", language, e)
         # Fallback to default language
         if language != DEFAULT_LANGUAGE:
             return load_translations(DEFAULT_LANGUAGE)
@@ -86,30 +98,49 @@ def get_message(key: str, language: str = DEFAULT_LANGUAGE, **kwargs: Any) -> st
         >>> get_message('auth.login_success', 'es')
         'Inicio de sesión exitoso'
     """
+    message = _lookup_message(key, language)
+
+    # Handle string interpolation if kwargs are provided
+    if kwargs:
+        try:
+            return message.format(**kwargs)
+        except (KeyError, ValueError) as e:
+            logger.warning("Error formatting message '{}': {}", key, e)
+            return message
+
+    return message
+
+
+@lru_cache(maxsize=512)
+def _lookup_message(key: str, language: str) -> str:
+    """
+    Resolve a message key to its uninterpolated translation, with fallbacks.
+
+    Results are memoized per (key, language); the cache is cleared whenever
+    translations are cleared or reloaded.
+
+    Args:
+        key: Message key in dot notation (e.g., 'auth.login_success')
+        language: Language code
+
+    Returns:
+        Translated message string, or the key itself if no translation exists
+    """
     translations = load_translations(language)
 
     # Navigate through nested keys
-    keys = key.split(".")
     message: Any = translations
 
     try:
-        for k in keys:
+        for k in key.split("."):
             message = message[k]
     except (KeyError, TypeError):
-        logger.warning(f"Translation key not found: {key} for language: {language}")
+        logger.warning("Translation key not found: {} for language: {}", key, language)
         # Fallback to default language
         if language != DEFAULT_LANGUAGE:
-            return get_message(key, DEFAULT_LANGUAGE, **kwargs)
+            return _lookup_message(key, DEFAULT_LANGUAGE)
         return key  # Return the key itself as fallback
 
-    # Handle string interpolation if kwargs are provided
-    if kwargs and isinstance(message, str):
-        try:
-            return message.format(**kwargs)
-        except (KeyError, ValueError) as e:
-            logger.warning(f"Error formatting message '{key}': {str(e)}")
-            return message
-
     return str(message) if message is not None else key
 
 
@@ -120,7 +151,7 @@ def get_supported_languages() -> list[str]:
 
 def is_language_supported(language: str) -> bool:
     """Check if a language is supported."""
-    return language in SUPPORTED_LANGUAGES
+    return language in SUPPORTED_LANGUAGE_SET
 
 
 def get_default_language() -> str:
@@ -128,10 +159,28 @@ def get_default_language() -> str:
     return DEFAULT_LANGUAGE
 
 
+def register_cache_clear_callback(callback: Callable[[], None]) -> None:
+    """
+    Register a callback to run whenever translations are cleared or reloaded.
+
+    Args:
+        callback: Function clearing a cache that depends on translated messages
+    """
+    _cache_clear_callbacks.append(callback)
+
+
+def _clear_message_caches() -> None:
+    """Clear the memoized message lookups and every cache derived from them."""
+    _lookup_message.cache_clear()
+    for callback in _cache_clear_callbacks:
+        callback()
+
+
 def clear_translation_cache() -> None:
     """Clear the translation cache. Useful for testing or reloading translations."""
     global _translation_cache
     _translation_cache.clear()
+    _clear_message_caches()
     logger.debug("Translation cache cleared")
 
 
@@ -145,12 +194,13 @@ def reload_translations(language: Optional[str] = None) -> None:
     if language:
         if language in _translation_cache:
             del _translation_cache[language]
+        _clear_message_caches()
         load_translations(language)
     else:
         clear_translation_cache()
         for lang in SUPPORTED_LANGUAGES:
             load_translations(lang)
-    logger.debug(f"Reloaded translations for: {language or 'all languages'}")
+    logger.debug("Reloaded translations for: {}", language or "all languages")
 
 
 # Convenience functions for common message categories
@@ -204,9 +254,10 @@ def __(key: str, **kwargs: Any) -> str:
         >>> __("user.welcome", name="John")
         'Welcome John!'  # with interpolation
     """
-    from app.middlewares.language_middleware import get_current_language
-
-    current_lang = get_current_language()
+    current_lang = current_language.get()
+    if not kwargs:
+        # Fast path: a memoized (key, language) lookup with nothing to interpolate
+        return _lookup_message(key, current_lang)
     return get_message(key, current_lang, **kwargs)
 
 
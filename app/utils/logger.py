@@ -1,8 +1,9 @@
 import contextvars
 import os
 import sys
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
 
+import orjson
 from loguru import logger
 
 from app.config.settings import settings
@@ -19,16 +20,24 @@ text_format = (
     "<level>{message}</level>"
 )
 
-# JSON log format
-json_format = (
-    "{{"
-    '"timestamp": "{time:YYYY-MM-DD HH:mm:ss}", '
-    '"level": "{level}", '
-    '"request_id": "{extra[request_id]}", '
-    '"context": "{extra[context]}", '
-    '"message": "{message}"'
-    "}}"
-)
+
+def json_format(record: Any) -> str:
+    """
+    Format a log record as one JSON line, serialized with orjson.
+
+    The payload is stored on the record and referenced from the returned template,
+    so quotes or braces in the message cannot break the JSON or the loguru format.
+    """
+    record["extra"]["serialized"] = orjson.dumps(
+        {
+            "timestamp": record["time"].strftime("%Y-%m-%d %H:%M:%S"),
+            "level": record["level"].name,
+            "request_id": record["extra"].get("request_id"),
+            "context": record["extra"].get("context"),
+            "message": record["message"],
+        }
+    ).decode()
+    return "{extra[serialized]}\n{exception}" if record["exception"] else "{extra[serialized]}\n"
 
 
 def configure_logger() -> None:
@@ -37,7 +46,7 @@ def configure_logger() -> None:
     logger.remove()
 
     # Choose format based on configuration
-    log_format = json_format if settings.LOG_FORMAT_JSON else text_format
+    log_format: Union[str, Callable[[Any], str]] = json_format if settings.LOG_FORMAT_JSON else text_format
 
     # Configure console output
     logger.add(
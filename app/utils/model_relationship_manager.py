@@ -14,9 +14,11 @@ The manager is initialized at application startup and provides:
 - Support for nested CRUD operations
 """
 
+import sys
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Tuple, Type
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple, Type
 
 from sqlalchemy.orm import RelationshipProperty
 
@@ -26,6 +28,23 @@ from app.utils.tracing import get_trace_logger
 
 logger = get_trace_logger("model-relationship-manager")
 
+# Shared read-only results for unknown models, so lookups on them allocate nothing
+_NO_RELATIONSHIPS: Mapping[str, RelationshipProperty] = MappingProxyType({})
+_NO_EDGES: Tuple["RelationshipEdge", ...] = ()
+
+# Callbacks clearing caches derived from a manager's graph outside this module
+_initialize_callbacks: List[Callable[["ModelRelationshipManager"], None]] = []
+
+
+def register_initialize_callback(callback: Callable[["ModelRelationshipManager"], None]) -> None:
+    """
+    Register a callback to run whenever a relationship manager (re)builds its graph.
+
+    Args:
+        callback: Function receiving the manager, clearing caches derived from its graph
+    """
+    _initialize_callbacks.append(callback)
+
 
 @dataclass
 class ModelNode:
@@ -33,7 +52,7 @@ class ModelNode:
 
     model_class: Type[BaseModel]
     table_name: str
-    relationships: Dict[str, RelationshipProperty] = field(default_factory=dict)
+    relationships: Mapping[str, RelationshipProperty] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Extract relationships after initialization"""
@@ -125,8 +144,12 @@ class ModelRelationshipManager:
         """Initialize the relationship manager"""
         self._nodes: Dict[str, ModelNode] = {}
         self._edges: List[RelationshipEdge] = []
-        self._adjacency_list: Dict[str, List[RelationshipEdge]] = defaultdict(list)
-        self._reverse_adjacency_list: Dict[str, List[RelationshipEdge]] = defaultdict(list)
+        self._adjacency_list: Dict[str, Tuple[RelationshipEdge, ...]] = {}
+        self._reverse_adjacency_list: Dict[str, Tuple[RelationshipEdge, ...]] = {}
+        self._cascade_delete_relationships: Dict[str, Tuple[str, ...]] = {}
+        self._soft_delete_cascade_relationships: Dict[str, Tuple[str, ...]] = {}
+        self._dependencies: Dict[str, FrozenSet[str]] = {}
+        self._dependents: Dict[str, FrozenSet[str]] = {}
         self._initialized = False
 
         logger.info("ModelRelationshipManager initialized")
@@ -158,6 +181,11 @@ class ModelRelationshipManager:
         self._build_adjacency_lists()
 
         self._initialized = True
+
+        # Caches built from a previous graph must not outlive it
+        for callback in _initialize_callbacks:
+            callback(self)
+
         logger.info(f"ModelRelationshipManager initialized with {len(self._nodes)} nodes and {len(self._edges)} edges")
 
     def _discover_models(self) -> List[Type[BaseModel]]:
@@ -198,7 +226,8 @@ class ModelRelationshipManager:
         Args:
             model_class: The model class to register
         """
-        model_name = model_class.__name__
+        # Model names key every graph and cache lookup, so keep a single shared copy
+        model_name = sys.intern(model_class.__name__)
 
         if model_name in self._nodes:
             logger.warning(f"Model {model_name} already registered")
@@ -264,9 +293,29 @@ class ModelRelationshipManager:
 
     def _build_adjacency_lists(self) -> None:
         """Build adjacency lists for efficient graph traversal"""
+        outgoing: Dict[str, List[RelationshipEdge]] = defaultdict(list)
+        incoming: Dict[str, List[RelationshipEdge]] = defaultdict(list)
         for edge in self._edges:
-            self._adjacency_list[edge.source_model].append(edge)
-            self._reverse_adjacency_list[edge.target_model].append(edge)
+            outgoing[edge.source_model].append(edge)
+            incoming[edge.target_model].append(edge)
+
+        # Dependency closures cached from a previous graph no longer apply
+        self._dependencies.clear()
+        self._dependents.clear()
+
+        # Edges are handed out to callers as is, so store them immutably
+        self._adjacency_list = {model_name: tuple(edges) for model_name, edges in outgoing.items()}
+        self._reverse_adjacency_list = {model_name: tuple(edges) for model_name, edges in incoming.items()}
+
+        # Cascade relationship names only depend on the edges, so index them once here
+        self._cascade_delete_relationships = {
+            model_name: tuple(edge.relationship_name for edge in edges if edge.cascade_delete)
+            for model_name, edges in self._adjacency_list.items()
+        }
+        self._soft_delete_cascade_relationships = {
+            model_name: tuple(edge.relationship_name for edge in edges if edge.cascade_soft_delete)
+            for model_name, edges in self._adjacency_list.items()
+        }
 
     def get_model_node(self, model_name: str) -> Optional[ModelNode]:
         """
@@ -293,7 +342,7 @@ class ModelRelationshipManager:
         node = self.get_model_node(model_name)
         return node.model_class if node else None
 
-    def get_relationships(self, model_name: str) -> Dict[str, RelationshipProperty]:
+    def get_relationships(self, model_name: str) -> Mapping[str, RelationshipProperty]:
         """
         Get all relationships for a model.
 
@@ -304,9 +353,9 @@ class ModelRelationshipManager:
             Dictionary of relationship names to RelationshipProperty
         """
         node = self.get_model_node(model_name)
-        return node.relationships if node else {}
+        return node.relationships if node else _NO_RELATIONSHIPS
 
-    def get_outgoing_edges(self, model_name: str) -> List[RelationshipEdge]:
+    def get_outgoing_edges(self, model_name: str) -> Tuple[RelationshipEdge, ...]:
         """
         Get all outgoing edges from a model.
 
@@ -314,11 +363,35 @@ class ModelRelationshipManager:
             model_name: Name of the model
 
         Returns:
-            List of outgoing RelationshipEdge objects
+            Tuple of outgoing RelationshipEdge objects
         """
-        return self._adjacency_list.get(model_name, [])
+        return self._adjacency_list.get(model_name, _NO_EDGES)
 
-    def get_incoming_edges(self, model_name: str) -> List[RelationshipEdge]:
+    def get_cascade_delete_relationships(self, model_name: str) -> Tuple[str, ...]:
+        """
+        Get the names of a model's relationships that have cascade delete enabled.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Tuple of relationship names, computed when the graph was built
+        """
+        return self._cascade_delete_relationships.get(model_name, ())
+
+    def get_soft_delete_cascade_relationships(self, model_name: str) -> Tuple[str, ...]:
+        """
+        Get the names of a model's relationships that have soft delete cascade enabled.
+
+        Args:
+            model_name: Name of the model
+
+        Returns:
+            Tuple of relationship names, computed when the graph was built
+        """
+        return self._soft_delete_cascade_relationships.get(model_name, ())
+
+    def get_incoming_edges(self, model_name: str) -> Tuple[RelationshipEdge, ...]:
         """
         Get all incoming edges to a model.
 
@@ -326,9 +399,9 @@ class ModelRelationshipManager:
             model_name: Name of the model
 
         Returns:
-            List of incoming RelationshipEdge objects
+            Tuple of incoming RelationshipEdge objects
         """
-        return self._reverse_adjacency_list.get(model_name, [])
+        return self._reverse_adjacency_list.get(model_name, _NO_EDGES)
 
     def find_path(self, source_model: str, target_model: str, max_depth: int = 5) -> Optional[List[RelationshipEdge]]:
         """
@@ -402,7 +475,7 @@ class ModelRelationshipManager:
 
         return cycles
 
-    def get_model_dependencies(self, model_name: str) -> Set[str]:
+    def get_model_dependencies(self, model_name: str) -> FrozenSet[str]:
         """
         Get all models that the given model depends on (models it references).
 
@@ -410,25 +483,11 @@ class ModelRelationshipManager:
             model_name: Name of the model
 
         Returns:
-            Set of model names that this model depends on
+            Read-only set of model names that this model depends on
         """
-        dependencies = set()
-        visited = set()
-
-        def collect_dependencies(node: str) -> None:
-            if node in visited:
-                return
-
-            visited.add(node)
-
-            for edge in self.get_outgoing_edges(node):
-                dependencies.add(edge.target_model)
-                collect_dependencies(edge.target_model)
+        return self._collect_reachable(model_name, self._dependencies, self.get_outgoing_edges, "target_model")
 
-        collect_dependencies(model_name)
-        return dependencies
-
-    def get_model_dependents(self, model_name: str) -> Set[str]:
+    def get_model_dependents(self, model_name: str) -> FrozenSet[str]:
         """
         Get all models that depend on the given model (models that reference it).
 
@@ -436,23 +495,52 @@ class ModelRelationshipManager:
             model_name: Name of the model
 
         Returns:
-            Set of model names that depend on this model
+            Read-only set of model names that depend on this model
         """
-        dependents = set()
-        visited = set()
+        return self._collect_reachable(model_name, self._dependents, self.get_incoming_edges, "source_model")
+
+    def _collect_reachable(
+        self,
+        model_name: str,
+        cache: Dict[str, FrozenSet[str]],
+        get_edges: Callable[[str], Tuple[RelationshipEdge, ...]],
+        edge_attr: str,
+    ) -> FrozenSet[str]:
+        """
+        Collect all models transitively reachable from a model along one edge direction.
 
-        def collect_dependents(node: str) -> None:
-            if node in visited:
-                return
+        The graph does not change after initialization, so results are cached per
+        model from then on.
 
-            visited.add(node)
+        Args:
+            model_name: Name of the model to start from
+            cache: Cache of previously collected results for this direction
+            get_edges: Function returning the edges to follow from a model
+            edge_attr: Edge attribute holding the model reached by an edge
 
-            for edge in self.get_incoming_edges(node):
-                dependents.add(edge.source_model)
-                collect_dependents(edge.source_model)
+        Returns:
+            Read-only set of reachable model names
+        """
+        reachable = cache.get(model_name)
+        if reachable is not None:
+            return reachable
+
+        found: Set[str] = set()
+        visited = {model_name}
+        stack = [model_name]
+
+        while stack:
+            for edge in get_edges(stack.pop()):
+                next_model = getattr(edge, edge_attr)
+                found.add(next_model)
+                if next_model not in visited:
+                    visited.add(next_model)
+                    stack.append(next_model)
 
-        collect_dependents(model_name)
-        return dependents
+        reachable = frozenset(found)
+        if self._initialized:
+            cache[model_name] = reachable
+        return reachable
 
     def get_relationship_path(
         self, source_model: str, target_model: str, path: List[str]
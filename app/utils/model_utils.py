@@ -5,7 +5,7 @@ This module provides convenient access to the model relationship manager
 and common operations for working with model relationships.
 """
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type
 
 from app.models.base_model import BaseModel
 from app.utils.model_relationship_manager import (
@@ -40,7 +40,7 @@ def get_model_class(model_name: str) -> Optional[Type[BaseModel]]:
     return manager.get_model_class(model_name)
 
 
-def get_model_relationships(model_name: str) -> Dict[str, Any]:
+def get_model_relationships(model_name: str) -> Mapping[str, Any]:
     """
     Get all relationships for a model.
 
@@ -108,7 +108,7 @@ def find_model_path(source_model: str, target_model: str, max_depth: int = 5) ->
     return manager.find_path(source_model, target_model, max_depth)
 
 
-def get_model_dependencies(model_name: str) -> set[str]:
+def get_model_dependencies(model_name: str) -> frozenset[str]:
     """
     Get all models that the given model depends on.
 
@@ -116,13 +116,13 @@ def get_model_dependencies(model_name: str) -> set[str]:
         model_name: Name of the model
 
     Returns:
-        Set of model names that this model depends on
+        Read-only set of model names that this model depends on
     """
     manager = get_model_manager()
     return manager.get_model_dependencies(model_name)
 
 
-def get_model_dependents(model_name: str) -> set[str]:
+def get_model_dependents(model_name: str) -> frozenset[str]:
     """
     Get all models that depend on the given model.
 
@@ -130,7 +130,7 @@ def get_model_dependents(model_name: str) -> set[str]:
         model_name: Name of the model
 
     Returns:
-        Set of model names that depend on this model
+        Read-only set of model names that depend on this model
     """
     manager = get_model_manager()
     return manager.get_model_dependents(model_name)
@@ -167,7 +167,7 @@ def is_relationship_field(model_name: str, field_name: str) -> bool:
     return field_name in relationships
 
 
-def get_relationship_edges(model_name: str, direction: str = "outgoing") -> List[RelationshipEdge]:
+def get_relationship_edges(model_name: str, direction: str = "outgoing") -> Tuple[RelationshipEdge, ...]:
     """
     Get relationship edges for a model.
 
@@ -176,7 +176,7 @@ def get_relationship_edges(model_name: str, direction: str = "outgoing") -> List
         direction: "outgoing" or "incoming"
 
     Returns:
-        List of RelationshipEdge objects
+        Tuple of RelationshipEdge objects
     """
     manager = get_model_manager()
 
@@ -45,6 +45,21 @@ class RelationshipAdapter:
         MANYTOMANY: RelationshipType.MANY_TO_MANY,
     }
 
+    # Repository method names handling each relationship type
+    HANDLER_METHODS: Dict[RelationshipType, str] = {
+        RelationshipType.ONE_TO_ONE: "_handle_one_to_one",
+        RelationshipType.ONE_TO_MANY: "_handle_one_to_many",
+        RelationshipType.MANY_TO_ONE: "_handle_many_to_one",
+        RelationshipType.MANY_TO_MANY: "_handle_many_to_many",
+    }
+
+    MANAGER_METHODS: Dict[RelationshipType, str] = {
+        RelationshipType.ONE_TO_ONE: "_manage_one_to_one_relations",
+        RelationshipType.ONE_TO_MANY: "_manage_one_to_many_relations",
+        RelationshipType.MANY_TO_ONE: "_manage_many_to_one_relations",
+        RelationshipType.MANY_TO_MANY: "_manage_many_to_many_relations",
+    }
+
     @classmethod
     def get_sqlalchemy_direction(cls, relationship_type: RelationshipType) -> Any:
         """
@@ -99,13 +114,7 @@ class RelationshipAdapter:
         Returns:
             Handler method name
         """
-        handlers = {
-            RelationshipType.ONE_TO_ONE: "_handle_one_to_one",
-            RelationshipType.ONE_TO_MANY: "_handle_one_to_many",
-            RelationshipType.MANY_TO_ONE: "_handle_many_to_one",
-            RelationshipType.MANY_TO_MANY: "_handle_many_to_many",
-        }
-        return handlers[relationship_type]
+        return cls.HANDLER_METHODS[relationship_type]
 
     @classmethod
     def get_manager_method(cls, relationship_type: RelationshipType) -> str:
@@ -118,10 +127,4 @@ class RelationshipAdapter:
         Returns:
             Manager method name
         """
-        managers = {
-            RelationshipType.ONE_TO_ONE: "_manage_one_to_one_relations",
-            RelationshipType.ONE_TO_MANY: "_manage_one_to_many_relations",
-            RelationshipType.MANY_TO_ONE: "_manage_many_to_one_relations",
-            RelationshipType.MANY_TO_MANY: "_manage_many_to_many_relations",
-        }
-        return managers[relationship_type]
+        return cls.MANAGER_METHODS[relationship_type]
@@ -1,8 +1,8 @@
 from contextvars import ContextVar
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.utils.logger import get_logger
 
@@ -13,19 +13,21 @@ if TYPE_CHECKING:
 _current_user_data: ContextVar[Optional[Dict[str, Any]]] = ContextVar("current_user_data", default=None)
 
 
-class RequestContextMiddleware(BaseHTTPMiddleware):
+class RequestContextMiddleware:
     """
     Middleware that makes request context available throughout the request lifecycle.
     This allows accessing request info like the request_id from anywhere in the code.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # The request ID is already set in LoggingMiddleware,
         # but we could add more request context here if needed
 
         # Continue processing the request
-        response = await call_next(request)
-        return response
+        await self.app(scope, receive, send)
 
 
 def get_context_logger(name: Optional[str] = None) -> "Logger":
@@ -7,6 +7,7 @@ import uuid
 from typing import TYPE_CHECKING, Optional
 
 from fastapi import Request, Response
+from starlette.types import Scope
 
 from app.utils.logger import get_logger, set_request_id
 
@@ -54,19 +55,41 @@ def set_trace_context_from_request(request: Request) -> str:
     Returns:
         The request ID that was set
     """
-    # Use existing request ID from headers if available
-    request_id: Optional[str] = request.headers.get("X-Request-ID")
+    return set_trace_context_from_scope(request.scope)
+
+
+def set_trace_context_from_scope(scope: Scope) -> str:
+    """
+    Set tracing context based on an ASGI connection scope.
+
+    Works on the raw scope so ASGI middleware does not need to build a Request.
+    The request ID is taken from the X-Request-ID header, then from the request
+    state, and is generated if neither has one.
+
+    Args:
+        scope: The ASGI connection scope
+
+    Returns:
+        The request ID that was set
+    """
+    # Use existing request ID from headers if available (ASGI header names are lowercase)
+    request_id: Optional[str] = None
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            request_id = value.decode("latin-1")
+            break
 
     # If no request ID in headers, check if it was already set in request.state
+    state = scope.setdefault("state", {})
     if not request_id:
-        request_id = getattr(request.state, "request_id", None)
+        request_id = state.get("request_id")
 
     # If still no request ID, generate a new one
     if not request_id:
         request_id = generate_request_id()
 
     # Set the request ID in the request.state for other middleware/handlers
-    request.state.request_id = request_id
+    state["request_id"] = request_id
 
     # Set the request ID in the context for logging
     set_request_id(request_id)
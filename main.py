@@ -1,19 +1,40 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.exc import IntegrityError
 
+from app.config.database import warmup_pool
 from app.config.middlewares import setup_middlewares
 from app.config.settings import settings
 from app.controllers import api_router
 from app.handlers.exception_handler import exception_handler
+from app.utils.logger import get_logger
 from app.utils.model_relationship_manager import initialize_model_relationships
 
+logger = get_logger("main")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Pre-warm the database connection pool before serving requests"""
+    try:
+        await warmup_pool(settings.DB_POOL_SIZE // 2)
+    except Exception as e:
+        logger.warning("Database pool warmup failed: {}", e)
+    yield
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
     version=settings.PROJECT_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Initialize model relationships
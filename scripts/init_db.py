@@ -51,7 +51,7 @@ def init_db() -> None:
         # Add admin user if no users exist
         if user_count == 0:
             logger.info("Creating admin user...")
-            admin_user = User(
+            admin_user = User.create(
                 username="admin",
                 email="admin@example.com",
                 password="adminpassword",  # nosec B106 - Development default
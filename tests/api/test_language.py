@@ -0,0 +1,52 @@
+"""
+Tests for language endpoints.
+"""
+from fastapi import status
+from fastapi.testclient import TestClient
+
+from app.utils import i18n
+
+
+def test_supported_languages(client: TestClient):
+    """
+    Test the supported languages endpoint returns cache headers.
+    """
+    response = client.get("/api/v1/language/supported", headers={"Accept-Language": "en"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert response.headers["etag"].startswith('W/"')
+    data = response.json()
+    assert data["success"] is True
+    assert [language["code"] for language in data["data"]["supported_languages"]] == ["en", "jp"]
+
+
+def test_supported_languages_not_modified(client: TestClient):
+    """
+    Test the supported languages endpoint answers a matching If-None-Match with 304.
+    """
+    etag = client.get("/api/v1/language/supported", headers={"Accept-Language": "en"}).headers["etag"]
+
+    response = client.get("/api/v1/language/supported", headers={"Accept-Language": "en", "If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = client.get("/api/v1/language/supported", headers={"Accept-Language": "jp", "If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+
+def test_supported_languages_etag_follows_translations(client: TestClient):
+    """
+    Test the supported languages ETag changes when the translated messages are reloaded.
+    """
+    etag = client.get("/api/v1/language/supported", headers={"Accept-Language": "en"}).headers["etag"]
+
+    try:
+        i18n.reload_translations("en")
+        i18n._translation_cache["en"] = {"language": {"current": "Changed current language"}}
+
+        response = client.get("/api/v1/language/supported", headers={"Accept-Language": "en", "If-None-Match": etag})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["etag"] != etag
+    finally:
+        i18n.clear_translation_cache()
@@ -146,7 +146,7 @@ async def test_user(db: AsyncSession) -> User:
         "password": "testpassword123",
         "full_name": "Test User",
     }
-    user = User(**user_data)
+    user = User.create(**user_data)
     db.add(user)
     await db.commit()
     await db.refresh(user)
@@ -0,0 +1,38 @@
+"""
+Unit tests for authentication dependencies.
+"""
+
+from unittest import mock
+
+import pytest
+
+from app.exceptions import TokenInvalidException
+from app.utils import auth
+from app.utils.auth import create_access_token, get_current_username
+from app.utils.request_context import set_current_user_data
+
+
+class TestGetCurrentUsername:
+    """Test cases for get_current_username"""
+
+    async def test_payload_verified_by_middleware_is_reused(self):
+        """Test that a payload stored by AuthMiddleware is used without decoding the token again"""
+        set_current_user_data({"sub": "alice"})
+
+        with mock.patch.object(auth, "decode_token") as decode_token:
+            assert await get_current_username(token="unused") == "alice"
+
+        decode_token.assert_not_called()
+
+    async def test_token_is_decoded_without_context_data(self):
+        """Test that the token is decoded when no middleware payload is available"""
+        token = create_access_token({"sub": "bob"})
+
+        assert await get_current_username(token=token) == "bob"
+
+    async def test_missing_sub_claim_is_rejected(self):
+        """Test that a payload without a 'sub' claim is rejected"""
+        set_current_user_data({"scope": "read"})
+
+        with pytest.raises(TokenInvalidException):
+            await get_current_username(token="unused")
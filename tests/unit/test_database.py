@@ -0,0 +1,21 @@
+"""
+Unit tests for the request-scoped database session dependency.
+"""
+
+from app.config.database import SessionLocal, get_db
+
+
+class TestGetDb:
+    """Test cases for get_db"""
+
+    async def test_session_is_removed_without_middleware(self):
+        """Test that the dependency discards its session even when DBSessionMiddleware is not installed"""
+        dependency = get_db()
+        session = await dependency.__anext__()
+
+        assert SessionLocal.registry.has()
+        assert session is SessionLocal()
+
+        await dependency.aclose()
+
+        assert not SessionLocal.registry.has()
@@ -0,0 +1,64 @@
+"""
+Unit tests for Firebase token verification coalescing.
+"""
+
+import asyncio
+from unittest import mock
+
+import pytest
+
+from app.services.firebase_service import FirebaseService
+
+
+def build_service(verify_token: mock.AsyncMock) -> FirebaseService:
+    """Build an initialized FirebaseService whose SDK verification is replaced"""
+    with mock.patch.object(FirebaseService, "_initialize_firebase"):
+        service = FirebaseService()
+    service._initialized = True
+    service._verify_token = verify_token
+    return service
+
+
+class TestVerifyFirebaseToken:
+    """Test cases for FirebaseService.verify_firebase_token"""
+
+    async def test_concurrent_requests_share_one_verification(self):
+        """Test that concurrent verifications of the same token call the SDK once"""
+        release = asyncio.Event()
+
+        async def verify(id_token, token_digest):
+            await release.wait()
+            return {"uid": "user-1"}
+
+        verify_token = mock.AsyncMock(side_effect=verify)
+        service = build_service(verify_token)
+
+        requests = [asyncio.ensure_future(service.verify_firebase_token("token")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*requests) == [{"uid": "user-1"}] * 3
+        verify_token.assert_awaited_once()
+        assert not service._inflight_verifications
+
+    async def test_cancelled_leader_does_not_fail_waiters(self):
+        """Test that cancelling the request that started a verification leaves other waiters unaffected"""
+        release = asyncio.Event()
+
+        async def verify(id_token, token_digest):
+            await release.wait()
+            return {"uid": "user-1"}
+
+        service = build_service(mock.AsyncMock(side_effect=verify))
+
+        leader = asyncio.ensure_future(service.verify_firebase_token("token"))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(service.verify_firebase_token("token"))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == {"uid": "user-1"}
@@ -0,0 +1,95 @@
+"""
+Unit tests for language detection.
+"""
+
+from app.middlewares.language_middleware import LanguageDetectionMiddleware, parse_accept_language
+
+
+class TestParseAcceptLanguage:
+    """Test cases for Accept-Language parsing"""
+
+    def parse(self, accept_language: str):
+        """Parse an Accept-Language header"""
+        return parse_accept_language(accept_language)
+
+    def test_highest_quality_supported_language_wins(self):
+        """Test that the supported language with the highest quality is chosen"""
+        assert self.parse("en;q=0.5,jp;q=0.9") == "jp"
+        assert self.parse("fr,jp-JP;q=0.8,en;q=0.7") == "jp"
+
+    def test_ties_keep_header_order(self):
+        """Test that equal qualities resolve to the earliest entry"""
+        assert self.parse("jp, en") == "jp"
+        assert self.parse("EN-us,jp") == "en"
+
+    def test_unsupported_or_unacceptable_languages_are_ignored(self):
+        """Test that unsupported tags and q=0 entries yield no language"""
+        assert self.parse("fr,de;q=0.9") is None
+        assert self.parse("jp;q=0") is None
+        assert self.parse("") is None
+
+    def test_malformed_quality_defaults_to_one(self):
+        """Test that an unparseable quality value counts as 1.0"""
+        assert self.parse("en;q=0.5,jp;q=abc") == "jp"
+
+
+class TestDetectLanguage:
+    """Test cases for language detection from the raw ASGI scope"""
+
+    def detect(self, query_string: bytes = b"", headers=()):
+        """Detect the language of a request with the given query string and headers"""
+        scope = {"type": "http", "query_string": query_string, "headers": list(headers)}
+        language, _ = LanguageDetectionMiddleware(app=None)._detect_language(scope)
+        return language
+
+    def test_query_parameter_takes_priority(self):
+        """Test that a supported lang query parameter wins over headers and cookies"""
+        headers = [(b"accept-language", b"en"), (b"cookie", b"language=en")]
+        assert self.detect(b"page=2&lang=jp", headers) == "jp"
+        assert self.detect(b"lang=fr", headers) == "en"
+
+    def test_accept_language_before_cookie(self):
+        """Test that Accept-Language is checked before the language cookie"""
+        assert self.detect(headers=[(b"cookie", b"language=en"), (b"accept-language", b"jp")]) == "jp"
+
+    def test_language_cookie_is_read_from_raw_header(self):
+        """Test that the language cookie is found among other cookies"""
+        assert self.detect(headers=[(b"cookie", b"session=abc; language=jp; theme=dark")]) == "jp"
+        assert self.detect(headers=[(b"cookie", b"xlanguage=jp")]) == "en"
+
+
+class TestLanguageCookie:
+    """Test cases for the language cookie written by the middleware"""
+
+    async def call(self, method: str = "GET", path: str = "/", query_string: bytes = b"", headers=()):
+        """Run a request through the middleware and return the response start message"""
+        messages = []
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {"type": "http", "method": method, "path": path, "query_string": query_string, "headers": list(headers)}
+        await LanguageDetectionMiddleware(app)(scope, None, send)
+        return messages[0]
+
+    async def test_cookie_is_set_when_language_changes(self):
+        """Test that Set-Cookie is emitted when the client has no matching cookie"""
+        message = await self.call(headers=[(b"accept-language", b"jp"), (b"cookie", b"language=en")])
+
+        assert any(name == b"set-cookie" and value.startswith(b"language=jp") for name, value in message["headers"])
+
+    async def test_cookie_is_skipped_when_unchanged(self):
+        """Test that no Set-Cookie is emitted for a matching cookie or a preflight"""
+        message = await self.call(headers=[(b"cookie", b"language=jp")])
+        assert message["headers"] == []
+
+        message = await self.call(method="OPTIONS")
+        assert message["headers"] == []
+
+    async def test_skipped_paths_bypass_detection(self):
+        """Test that documentation paths get neither detection nor a cookie"""
+        message = await self.call(path="/openapi.json", query_string=b"lang=jp")
+        assert message["headers"] == []
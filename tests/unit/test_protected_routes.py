@@ -0,0 +1,166 @@
+"""
+Unit tests for protected route collection, matching and token extraction.
+"""
+
+from fastapi import Request
+
+from app.config.custom_router import APIRouter, path_to_regex
+from app.config.middlewares import collect_protected_routes, compile_protected_routes, literal_prefix
+from app.middlewares.auth_middleware import AuthMiddleware
+
+
+def build_router() -> APIRouter:
+    """Build a router tree with one public and one protected sub-router"""
+    public_router = APIRouter()
+    protected_router = APIRouter()
+
+    @public_router.get("/token")
+    def token() -> None:
+        return None
+
+    @protected_router.get("/profile")
+    def profile() -> None:
+        return None
+
+    @protected_router.get("/users/{user_id}")
+    def user(user_id: int) -> None:
+        return None
+
+    api_router = APIRouter()
+    api_router.include_router(public_router, prefix="/api/v1/auth")
+    api_router.include_router(protected_router, prefix="/api/v1/auth", requires_auth=True)
+    return api_router
+
+
+class TestCompileProtectedRoutes:
+    """Test cases for compile_protected_routes"""
+
+    def test_static_route_matches_exactly(self):
+        """Test that a static pattern only matches its own path"""
+        protected = compile_protected_routes([path_to_regex("/api/v1/auth/profile")])
+
+        assert protected.match("/api/v1/auth/profile")
+        assert not protected.match("/api/v1/auth/profile/extra")
+        assert not protected.match("/api/v1/auth/token")
+
+    def test_path_parameter_matches_single_segment(self):
+        """Test that a path parameter placeholder matches exactly one segment"""
+        protected = compile_protected_routes([path_to_regex("/api/v1/users/{user_id}")])
+
+        assert protected.match("/api/v1/users/42")
+        assert not protected.match("/api/v1/users/42/posts")
+        assert not protected.match("/api/v1/users/")
+
+    def test_literal_characters_are_escaped(self):
+        """Test that regex metacharacters in a path are matched literally"""
+        protected = compile_protected_routes([path_to_regex("/api/v1/files/{name}.json")])
+
+        assert protected.match("/api/v1/files/report.json")
+        assert not protected.match("/api/v1/files/reportXjson")
+
+    def test_no_protected_routes_matches_nothing(self):
+        """Test that an empty pattern list never requires authentication"""
+        protected = compile_protected_routes([])
+
+        assert not protected.match("/")
+        assert not protected.match("/api/v1/auth/profile")
+
+
+class TestCollectProtectedRoutes:
+    """Test cases for collect_protected_routes"""
+
+    def test_static_and_dynamic_routes_are_split(self):
+        """Test that static paths go to the set and parameterized ones to the regex"""
+        static_paths, _, dynamic_routes = collect_protected_routes(build_router())
+
+        assert static_paths == frozenset({"/api/v1/auth/profile"})
+        assert dynamic_routes.match("/api/v1/auth/users/7")
+        assert not dynamic_routes.match("/api/v1/auth/profile")
+
+    def test_public_routes_are_not_collected(self):
+        """Test that routes from public routers are not protected"""
+        static_paths, _, dynamic_routes = collect_protected_routes(build_router())
+
+        assert "/api/v1/auth/token" not in static_paths
+        assert not dynamic_routes.match("/api/v1/auth/token")
+
+    def test_repeated_includes_are_deduplicated(self):
+        """Test that including the same protected routes twice records each pattern once"""
+        api_router = build_router()
+        protected_router = APIRouter()
+
+        @protected_router.get("/profile")
+        def profile() -> None:
+            return None
+
+        api_router.include_router(protected_router, prefix="/api/v1/auth", requires_auth=True)
+
+        assert api_router.protected_static == {"/api/v1/auth/profile"}
+        assert api_router.protected_dynamic == {path_to_regex("/api/v1/auth/users/{user_id}")}
+
+    def test_nested_includes_are_flattened(self):
+        """Test that protected routes from nested routers reach the top-level router"""
+        v1_router = build_router()
+        root_router = APIRouter()
+        root_router.include_router(v1_router, prefix="/root")
+
+        static_paths, _, dynamic_routes = collect_protected_routes(root_router)
+
+        assert static_paths == frozenset({"/root/api/v1/auth/profile"})
+        assert dynamic_routes.match("/root/api/v1/auth/users/7")
+
+    def test_dynamic_route_prefixes_are_literal(self):
+        """Test that dynamic routes contribute their unescaped literal prefix"""
+        _, dynamic_prefixes, _ = collect_protected_routes(build_router())
+
+        assert dynamic_prefixes == ("/api/v1/auth/users/",)
+        assert literal_prefix(path_to_regex("/api/v1/files.v2/{name}")) == "/api/v1/files.v2/"
+
+
+class TestAuthMiddlewareRouteMatching:
+    """Test cases for AuthMiddleware route decisions"""
+
+    def build_middleware(self) -> AuthMiddleware:
+        """Build an AuthMiddleware from the sample router tree"""
+        protected_paths, protected_prefixes, protected_routes = collect_protected_routes(build_router())
+        return AuthMiddleware(
+            app=None,
+            protected_routes=protected_routes,
+            protected_paths=protected_paths,
+            protected_prefixes=protected_prefixes,
+        )
+
+    def test_static_and_dynamic_paths_require_auth(self):
+        """Test that both static and parameterized protected paths require authentication"""
+        middleware = self.build_middleware()
+
+        assert middleware._requires_auth("/api/v1/auth/profile")
+        assert middleware._requires_auth("/api/v1/auth/users/7")
+
+    def test_public_paths_do_not_require_auth(self):
+        """Test that public and unknown paths pass through"""
+        middleware = self.build_middleware()
+
+        assert not middleware._requires_auth("/api/v1/auth/token")
+        assert not middleware._requires_auth("/api/v1/auth/users/7/extra")
+
+
+class TestAuthMiddlewareTokenExtraction:
+    """Test cases for AuthMiddleware token extraction"""
+
+    def extract(self, authorization: str):
+        """Extract the token from a request carrying the given Authorization header"""
+        request = Request({"type": "http", "headers": [(b"authorization", authorization.encode())]})
+        return AuthMiddleware(app=None, protected_routes=compile_protected_routes([]))._extract_token(request)
+
+    def test_bearer_scheme_is_case_insensitive(self):
+        """Test that the Bearer scheme is accepted regardless of case"""
+        assert self.extract("Bearer abc") == "abc"
+        assert self.extract("bearer abc") == "abc"
+        assert self.extract("BEARER abc") == "abc"
+
+    def test_other_schemes_and_empty_tokens_are_rejected(self):
+        """Test that non-Bearer schemes and empty tokens yield no token"""
+        assert self.extract("Basic abc") is None
+        assert self.extract("Bearer ") is None
+        assert self.extract("Bearer") is None
@@ -41,8 +41,7 @@ async def create_test_user(
         # This likely means the table doesn't exist yet
 
     # Create a new user
-    # The User constructor expects username, email, password, full_name, is_superuser
-    user = User(
+    user = User.create(
         username=username,
         email=email,
         password=password,  # The model will hash it